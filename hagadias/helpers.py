@@ -5,7 +5,7 @@ import random
 import re
 from math import gcd
 from pathlib import Path
-from typing import Iterator, List, Tuple, Optional
+from typing import Iterable, Iterator, List, Tuple, Optional
 
 from lxml import etree as et
 import pefile
@@ -362,6 +362,9 @@ def strip_newstyle_qud_colors(phrase: str) -> str:
     return "".join(text for text, shader in parsed)
 
 
+OLDSTYLE_COLOR_CODE_PATTERN = re.compile("&[rRwWcCbBgGmMyYkKoO]")
+
+
 def strip_oldstyle_qud_colors(text: str) -> str:
     """Remove the old-style Qud color codes from a string, returning the plain text only.
 
@@ -370,7 +373,7 @@ def strip_oldstyle_qud_colors(text: str) -> str:
     becomes
         "raw beetle meat"
     """
-    return re.sub("&[rRwWcCbBgGmMyYkKoO]", "", text)
+    return OLDSTYLE_COLOR_CODE_PATTERN.sub("", text)
 
 
 def extract_color(colorstr: str, prefix_symbol: str) -> str | None:
@@ -407,6 +410,23 @@ def extract_foreground_char(colorstr: str, default: Optional[str] = None) -> str
     return None if fg is None else fg[1]
 
 
+def extract_fore_back_chars(
+    colorstr: str, default_fore: Optional[str] = None, default_back: Optional[str] = None
+) -> Tuple[str | None, str | None]:
+    """Extracts both the foreground (&) and background (^) color chars from a colorstring in a
+    single pass. Equivalent to calling extract_foreground_char and extract_background_char."""
+    fore, back = default_fore, default_back
+    if colorstr is not None:
+        length = len(colorstr)
+        i = colorstr.find("&")
+        if -1 < i < length - 1 and colorstr[i + 1] in QUD_COLORS:
+            fore = colorstr[i + 1]
+        i = colorstr.find("^")
+        if -1 < i < length - 1 and colorstr[i + 1] in QUD_COLORS:
+            back = colorstr[i + 1]
+    return fore, back
+
+
 def pos_or_neg(num: int) -> str:
     """Returns a + or - symbol depending on the positivity or negativity of the provided integer."""
     if int(num) >= 0:
@@ -443,10 +463,9 @@ def make_list_from_words(wds: List[str]) -> str:
         return f'{", ".join(wds)}, and {last_wd}'
 
 
-def obj_has_any_part(qudobject, parts: List[str]) -> bool:
+def obj_has_any_part(qudobject, parts: Iterable[str]) -> bool:
     """Returns True if the QudObject has any of the specified parts"""
-    if parts is not None and len(parts) > 0:
-        for part in parts:
-            if getattr(qudobject, f"part_{part}", None) is not None:
-                return True
+    if parts is not None:
+        present_parts = qudobject.all_attributes.get("part")
+        return present_parts is not None and not present_parts.keys().isdisjoint(parts)
     return False
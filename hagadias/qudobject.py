@@ -297,12 +297,20 @@ class QudObject(NodeMixin):
         return text
 
     def inherits_from(self, name: str) -> bool:
-        """Returns True if this object is 'name' or inherits from 'name', False otherwise."""
-        if self.name == name:
-            return True
-        if self.is_root:
-            return False
-        return self.parent.inherits_from(name)
+        """Returns True if this object is 'name' or inherits from 'name', False otherwise.
+
+        The names along the inheritance path are collected into a set on first use and cached in
+        self._lineage once inheritance has been resolved, since the path can't change after that."""
+        if hasattr(self, "_lineage"):
+            return name in self._lineage
+        lineage = set()
+        ancestor = self
+        while ancestor is not None:
+            lineage.add(ancestor.name)
+            ancestor = ancestor.parent
+        if self.baked:
+            self._lineage = frozenset(lineage)
+        return name in lineage
 
     def is_specified(self, attr) -> bool:
         """Return True if `attr` is specified explicitly for this object,
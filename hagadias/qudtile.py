@@ -111,6 +111,7 @@ class QudTile:
         self.qudname = qudname
         self.raw_transparent = raw_transparent
         self.prefab_applicator = prefab_applicator
+        self._bytes = None  # PNG encoding of self.image, filled in by get_bytes()
 
         if (raw_tilecolor is None or raw_tilecolor == "") and colorstring is not None:
             raw_tilecolor = colorstring  # fall back to text mode color
@@ -170,6 +171,16 @@ class QudTile:
                     self.hasproblems = True
                     self.image = blank_image
 
+    @property
+    def image(self) -> PILImage:
+        """The PIL Image object for this tile."""
+        return self._image
+
+    @image.setter
+    def image(self, image: PILImage) -> None:
+        self._image = image
+        self._bytes = None  # the cached PNG encoding belongs to the previous image
+
     @classmethod
     def from_image_provider(cls, image_provider, qudname: str):
         """Create a QudTile given only an image provider object. Shorthand alternative to the usual
@@ -217,10 +228,15 @@ class QudTile:
         return png_b
 
     def get_bytes(self):
-        """Return the bytes representation of self image in PNG format."""
-        bytesio = self.get_bytesio()
-        bytesio.seek(0)
-        return bytesio.read()
+        """Return the bytes representation of self image in PNG format.
+
+        The encoding is cached until a new image is assigned to self.image. Callers that edit the
+        image in place should assign it back to self.image afterwards."""
+        if self._bytes is None:
+            bytesio = self.get_bytesio()
+            bytesio.seek(0)
+            self._bytes = bytesio.read()
+        return self._bytes
 
     def get_big_image(self):
         """Draw the big (10x, 160x240) tile for the wiki or discord."""
@@ -7,8 +7,7 @@ class sValue:
     "7,1d3,(t-1)d2-1"
 
     Methods:
-        __iter__: Return self as an iterable
-        __next__: To implement min(), max() for value range, and int()
+        __iter__: Iterate over the value range, to implement min() and max()
         __int__: Return the mean of the possible range
         __str__: Return the source sValue string
     """
@@ -42,24 +41,16 @@ class sValue:
             if modified:
                 self.low += int(modifier)
                 self.high += int(modifier)
-        self.current_iter = self.low
 
     def __iter__(self):
-        return self
+        return iter(range(self.low, self.high + 1))
 
     def __len__(self):
         return self.high - self.low + 1
 
-    def __next__(self):
-        if self.current_iter > self.high:
-            self.current_iter = self.low
-            raise StopIteration
-        else:
-            self.current_iter += 1
-            return self.current_iter - 1
-
     def __int__(self):
-        return sum(self) // len(self)
+        # the range is contiguous, so its mean is the midpoint of low and high
+        return (self.low + self.high) // 2
 
     def __str__(self):
         if len(self) == 1:
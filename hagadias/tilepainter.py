@@ -1,29 +1,79 @@
 import os
-from typing import List, Optional, Tuple, Callable
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from PIL import Image, ImageDraw
 
-from hagadias.helpers import extract_foreground_char, extract_background_char
+from hagadias.helpers import extract_foreground_char, extract_fore_back_chars, obj_has_any_part
 from hagadias.qudtile import QudTile, StandInTiles
-from hagadias.tilestyle import StyleManager
-
-HOLO_PARTS = ["part_HologramMaterial", "part_HologramWallMaterial", "part_HologramMaterialPrimary"]
-PAINTWALL_EXCEPTIONS = ["part_SultanMural"]  # parts that need custom painting; ignore PaintWall tag
+from hagadias.tilestyle import (
+    PAINT_ALOE_CROSSFLAME,
+    PAINT_ALOE_DISCHARGE,
+    PAINT_ALOE_FUGUE,
+    PAINT_DOUBLE_DOOR,
+    PAINT_DOUBLE_ENCLOSING,
+    PAINT_HOLOGRAM,
+    StyleManager,
+    StyleMetadata,
+)
+
+HOLO_PARTS = ("part_HologramMaterial", "part_HologramWallMaterial", "part_HologramMaterialPrimary")
+# parts that need custom painting; ignore PaintWall tag
+PAINTWALL_EXCEPTIONS = ("part_SultanMural",)
+_PAINTWALL_EXCEPTION_PARTS = tuple(name.removeprefix("part_") for name in PAINTWALL_EXCEPTIONS)
+HOLO_COLORS = ("&B", "&B", "b")  # color, tilecolor, detail
+ALOE_COLORS = {
+    # aloe part flag: ((ready color, ready detail), (cooldown color, cooldown detail))
+    PAINT_ALOE_DISCHARGE: (("&W", "w"), ("&w", "w")),
+    PAINT_ALOE_CROSSFLAME: (("&W", "R"), ("&w", "r")),
+    PAINT_ALOE_FUGUE: (("&G", "M"), ("&g", "m")),
+}
+# (direction marker, flipped marker) pairs, in the order they are checked
+DIRECTION_SWAPS = (("_w_", "_e_"), ("_w.", "_e."), ("_e_", "_w_"), ("_e.", "_w."))
+
+
+@lru_cache(maxsize=128)
+def _compose_walltrap_color(fore: str, back: str) -> str:
+    """Builds a walltrap colorstring. There are only a handful of distinct walltrap colors, so
+    painters share a single string instance for each of them."""
+    return f"&{fore}^{back}"
 
 
 class TilePainter:
+    __slots__ = (
+        "obj",
+        "color",
+        "tilecolor",
+        "detail",
+        "trans",
+        "file",
+        "standin",
+        "prefab_imitator",
+        "paintpath",
+        "random_tiles",
+        "_style_manager",
+        "_primed",
+        "_tile_count",
+        "_tile0",
+        "_meta0",
+        "_tiles",
+        "_tiles_metadata",
+        "_paint_flags",
+    )
+
     def __init__(self, obj):
-        """Create a TilePainter instance for this object and calculate the details needed to
-        color and render a tile.
+        """Create a TilePainter instance for this object.
 
-        Determines the colors and filepath that are required to create the tile. Actual tile
-        creation is deferred until the tile property is accessed.
+        The colors and filepath that are required to create the tile are determined the first time
+        a tile is requested, and actual tile creation is deferred until the tile property is
+        accessed.
 
         Parameters:
             obj: a QudObject
         """
 
         self.obj = obj
+        self._paint_flags: Optional[int] = None
         self.color = None
         self.tilecolor = None
         self.detail = None
@@ -31,12 +81,35 @@ class TilePainter:
         self.file = None
         self.standin = None
         self.prefab_imitator = None
+        random_tiles = obj.builder_RandomTile_Tiles
+        self.random_tiles: Tuple[str, ...] = (
+            () if random_tiles is None else tuple(random_tiles.split(","))
+        )
 
         self._style_manager = StyleManager(self)
 
+        self._primed = False
+        self._tile_count: Optional[int] = None
+        # most objects have a single tile, which is stored in _tile0/_meta0; the _tiles and
+        # _tiles_metadata dicts, keyed by tile index, are only created for objects that have
+        # alternate tiles and only hold the variants that have actually been painted
+        self._tile0: Optional[QudTile] = None
+        self._meta0: Optional[TilePainterMetadata] = None
+        self._tiles: Optional[Dict[int, QudTile]] = None
+        self._tiles_metadata: Optional[Dict[int, TilePainterMetadata]] = None
+
+    def _ensure_primed(self) -> None:
+        """Calculates the details needed to color and render this object's tiles, if that hasn't
+        been done yet. Painters that are never asked for a tile skip this work entirely."""
+        if self._primed:
+            return
+        self._primed = True
+        obj = self.obj
+
         tile_count = self.tile_count()
-        self._tiles: List[Optional[QudTile]] = [None] * tile_count
-        self._tiles_metadata: List[Optional[TilePainterMetadata]] = [None] * tile_count
+        if tile_count > 1:
+            self._tiles = {}
+            self._tiles_metadata = {}
 
         if tile_count > 0:
             self._apply_primer()
@@ -46,7 +119,7 @@ class TilePainter:
                 self.paintpath = self.parse_paint_path(obj.tag_PaintedFence_Value)
                 self._paint_fence()
             elif obj.tag_PaintedWall and obj.tag_PaintedWall_Value != "*delete":
-                if any(getattr(self.obj, part, None) is not None for part in PAINTWALL_EXCEPTIONS):
+                if obj_has_any_part(obj, _PAINTWALL_EXCEPTION_PARTS):
                     pass
                 else:
                     self.paintpath = self.parse_paint_path(obj.tag_PaintedWall_Value)
@@ -62,50 +135,64 @@ class TilePainter:
     def tile(self, tile_index: int = 0) -> QudTile | None:
         """Retrieves the painted QudTile for this object. If an index is supplied for an object that
         has multiple tiles, returns the alternate tile at the specified index."""
-        if tile_index >= len(self._tiles):
+        self._ensure_primed()
+        if tile_index >= self._tile_count:
             return None
-        if self._tiles[tile_index] is not None:
-            return self._tiles[tile_index]
-        if self.file is None or self.file == "":
-            if not self.standin:
-                return None
-            self._stylize_tile_variant(tile_index)
-            self._tiles[tile_index] = QudTile(
-                None,
-                self.color,
-                self.tilecolor,
-                self.detail,
-                self.obj.name,
-                self.trans,
-                self.standin,
-                self.prefab_imitator,
-            )
+        qud_tile = self._tile0 if self._tiles is None else self._tiles.get(tile_index)
+        if qud_tile is not None:
+            return qud_tile
+        has_file = self.file is not None and self.file != ""
+        if not has_file and not self.standin:
+            return None
+        self._stylize_tile_variant(tile_index)
+        qud_tile = self._make_tile(has_file)
+        if self._tiles is None:
+            self._tile0 = qud_tile
         else:
-            self._stylize_tile_variant(tile_index)
-            self._tiles[tile_index] = QudTile(
-                self.file,
-                self.color,
-                self.tilecolor,
-                self.detail,
-                self.obj.name,
-                self.trans,
-                None,
-                self.prefab_imitator,
-            )
-        return self._tiles[tile_index]
+            self._tiles[tile_index] = qud_tile
+        return qud_tile
 
     def all_tiles_and_metadata(self) -> Tuple[List[QudTile], List]:
         """Returns a list of QudTiles representing all the tile variations for this object, as well
         as a corrsponding list of TilePainterMetadata for each of those tiles."""
-        qud_tiles: List[QudTile] = []
-        metadata: List[TilePainterMetadata] = []
-        for idx, entry in enumerate(self._tiles):
-            qud_tile = self.tile(idx)
-            if qud_tile is None:
+        self._ensure_primed()
+        if self._tiles is not None and len(self._tiles) == 0:
+            self._paint_all_variants()
+        for idx in range(self._tile_count):
+            if self.tile(idx) is None:
                 raise  # shouldn't happen
-            qud_tiles.append(qud_tile)
-            metadata.append(self._tiles_metadata[idx])
-        return qud_tiles, metadata
+        if self._tiles is None:
+            if self._tile_count == 0:
+                return [], []
+            return [self._tile0], [self._meta0]
+        indices = range(self._tile_count)
+        return [self._tiles[i] for i in indices], [self._tiles_metadata[i] for i in indices]
+
+    def _paint_all_variants(self) -> None:
+        """Paints and caches every tile variant in index order. This is equivalent to calling tile()
+        for each index, but lets the StyleManager step through its style combinations in sequence
+        rather than decoding each tile index separately."""
+        variants = self._style_manager.apply_all_styles()
+        for tile_index in range(self._tile_count):
+            has_file = self.file is not None and self.file != ""
+            if not has_file and not self.standin:
+                return  # nothing to paint; tile() reports this for the remaining indices
+            self._tiles_metadata[tile_index] = self._make_metadata(next(variants))
+            self._tiles[tile_index] = self._make_tile(has_file)
+
+    def _make_tile(self, has_file: bool) -> QudTile:
+        """Creates a QudTile from the current state of this painter, using the stand-in tile if
+        there is no tile file."""
+        return QudTile(
+            self.file if has_file else None,
+            self.color,
+            self.tilecolor,
+            self.detail,
+            self.obj.name,
+            self.trans,
+            None if has_file else self.standin,
+            self.prefab_imitator,
+        )
 
     def _apply_primer(self):
         """Analyzes this object's tile metadata and defines its basic colors and filepaths. Most
@@ -135,84 +222,118 @@ class TilePainter:
         # determine tile filepath
         self.file = self.obj.part_Render_Tile
         if self.obj.builder_RandomTile:
-            self.file = self.obj.builder_RandomTile_Tiles.split(",")[0]
-
-        # apply special initial tile properties to certain objects and parts
-        if (
-            any(self.obj.is_specified(part) for part in HOLO_PARTS)
-            or self.obj.name == "Wraith-Knight Templar"
-        ):
-            # special handling for holograms
-            self.color, self.tilecolor, self.detail = "&B", "&B", "b"
-        elif self.obj.is_specified("part_AnimatedMaterialStasisfield"):
-            # special handling for stasis fields
-            self.color, self.tilecolor, self.detail, self.trans = "&C^M", "&C^M", "M", "M"
-        elif self.obj.is_specified("part_Gas") and self.obj.part_Gas_ColorString is not None:
-            # Cryo gas always retains ^Y bg color. Technically, other gases have ^k bg color if < 50
-            # density, but we will paint the "dense" version with their additional color
-            self.color = self.tilecolor = self.obj.part_Gas_ColorString
-            self.detail = None
-        elif self.obj.part_AnimatedMaterialTechlight is not None:
-            self.color = self.obj.part_AnimatedMaterialTechlight_baseColor
-            self.color = self.tilecolor = "&c" if self.color is None else self.color
-            self.detail = "Y"
-        elif self.obj.part_AnimatedMaterialGeneric is not None:
-            # use the colors from the zero frame of the AnimatedMaterialGeneric part, because
-            # when these are present, the object's Render part colors are never used.
-            part_detail = self.obj.part_AnimatedMaterialGeneric_DetailColorAnimationFrames
-            part_color = self.obj.part_AnimatedMaterialGeneric_ColorStringAnimationFrames
-            if part_detail is not None and part_detail.startswith("0="):
-                self.detail = (part_detail.split(",")[0]).split("=")[1]
-            if part_color is not None and part_color.startswith("0="):
-                self.color = self.tilecolor = (part_color.split(",")[0]).split("=")[1]
-        elif self.obj.part_SultanShrine is not None:
-            self.detail = "g"
-            self.color = self.tilecolor = extract_foreground_char(self.color, "y")
-            self.trans = "transparent"
-            self.file = "Terrain/sw_sultanstatue_1.bmp"
-        elif self.obj.part_SultanMural is not None:
-            self.file = "Walls/sw_mural_blank_c.bmp"
-        elif self.obj.part_PistonPressElement is not None:
-            self.file = "Items/sw_crusher_s_press.bmp"
-        elif self.obj.name == "PondDown":  # 'small crack' in Joppa
-            self.color = self.tilecolor = "&Y"  # Applied by the HiddenRender part
-            self.trans = "b"  # Applied by the RenderLiquidBackground part
-        elif self.obj.part_JiltedLoverProperties is not None:
-            part_color = self.obj.part_JiltedLoverProperties_Color
-            part_color = part_color if part_color is not None else "g"
-            self.color = self.tilecolor = f"&{part_color}"
+            self.file = self.random_tiles[0]
+
+        # apply special initial tile properties to certain objects and parts. Several objects match
+        # more than one of these cases, so only the first match is applied
+        obj = self.obj
+        if self.paint_flags & PAINT_HOLOGRAM or obj.name == "Wraith-Knight Templar":
+            self._prime_hologram()
+        elif obj.is_specified("part_AnimatedMaterialStasisfield"):
+            self._prime_stasisfield()
+        elif obj.is_specified("part_Gas") and obj.part_Gas_ColorString is not None:
+            self._prime_gas()
+        elif obj.part_AnimatedMaterialTechlight is not None:
+            self._prime_techlight()
+        elif obj.part_AnimatedMaterialGeneric is not None:
+            self._prime_animated_material()
+        elif obj.part_SultanShrine is not None:
+            self._prime_sultan_shrine()
+        elif obj.part_SultanMural is not None:
+            self._prime_sultan_mural()
+        elif obj.part_PistonPressElement is not None:
+            self._prime_piston_press()
+        elif obj.name == "PondDown":
+            self._prime_pond_down()
+        elif obj.part_JiltedLoverProperties is not None:
+            self._prime_jilted_lover()
+
+    def _prime_hologram(self):
+        """Special handling for holograms."""
+        self.color, self.tilecolor, self.detail = HOLO_COLORS
+
+    def _prime_stasisfield(self):
+        """Special handling for stasis fields."""
+        self.color, self.tilecolor, self.detail, self.trans = "&C^M", "&C^M", "M", "M"
+
+    def _prime_gas(self):
+        """Cryo gas always retains ^Y bg color. Technically, other gases have ^k bg color if < 50
+        density, but we will paint the "dense" version with their additional color."""
+        self.color = self.tilecolor = self.obj.part_Gas_ColorString
+        self.detail = None
+
+    def _prime_techlight(self):
+        self.color = self.obj.part_AnimatedMaterialTechlight_baseColor
+        self.color = self.tilecolor = "&c" if self.color is None else self.color
+        self.detail = "Y"
+
+    def _prime_animated_material(self):
+        """Use the colors from the zero frame of the AnimatedMaterialGeneric part, because when
+        these are present, the object's Render part colors are never used."""
+        part_detail = self.obj.part_AnimatedMaterialGeneric_DetailColorAnimationFrames
+        part_color = self.obj.part_AnimatedMaterialGeneric_ColorStringAnimationFrames
+        if part_detail is not None and part_detail.startswith("0="):
+            self.detail = part_detail.partition(",")[0].partition("=")[2]
+        if part_color is not None and part_color.startswith("0="):
+            self.color = self.tilecolor = part_color.partition(",")[0].partition("=")[2]
+
+    def _prime_sultan_shrine(self):
+        self.detail = "g"
+        self.color = self.tilecolor = extract_foreground_char(self.color, "y")
+        self.trans = "transparent"
+        self.file = "Terrain/sw_sultanstatue_1.bmp"
+
+    def _prime_sultan_mural(self):
+        self.file = "Walls/sw_mural_blank_c.bmp"
+
+    def _prime_piston_press(self):
+        self.file = "Items/sw_crusher_s_press.bmp"
+
+    def _prime_pond_down(self):
+        """The 'small crack' in Joppa."""
+        self.color = self.tilecolor = "&Y"  # Applied by the HiddenRender part
+        self.trans = "b"  # Applied by the RenderLiquidBackground part
+
+    def _prime_jilted_lover(self):
+        part_color = self.obj.part_JiltedLoverProperties_Color
+        part_color = part_color if part_color is not None else "g"
+        self.color = self.tilecolor = f"&{part_color}"
 
     def _stylize_tile_variant(self, tile_index: int = 0):
         """Morphs a tile into one of its variants, based on the provided zero-based tile index.
         This function uses the StyleManager to retrieve an object's alternate tile variations
         in a predetermined order, and defines the TilePainterMetadata associated with each tile,
-        storing that metadata in the self._tiles_metadata List."""
+        storing that metadata in self._meta0 or the self._tiles_metadata dict."""
 
         metadata = self._style_manager.apply_style(tile_index)
 
-        if self._tiles_metadata[tile_index] is None:
-            painter_postfix = metadata.postfix
-            painter_type = metadata.type
-            painter_postfix = None if painter_postfix == "" else painter_postfix
-            painter_type = "default" if painter_type == "" else painter_type
-            painter_metadata = TilePainterMetadata(self.obj, painter_postfix, painter_type)
-            self._tiles_metadata[tile_index] = painter_metadata
+        if self._tiles_metadata is None:
+            if self._meta0 is None:
+                self._meta0 = self._make_metadata(metadata)
+        elif tile_index not in self._tiles_metadata:
+            self._tiles_metadata[tile_index] = self._make_metadata(metadata)
+
+    def _make_metadata(self, metadata: StyleMetadata) -> "TilePainterMetadata":
+        """Converts the StyleMetadata for a tile into the TilePainterMetadata that we expose."""
+        painter_postfix = metadata.postfix
+        painter_type = metadata.type
+        painter_postfix = None if painter_postfix == "" else painter_postfix
+        painter_type = "default" if painter_type == "" else painter_type
+        return TilePainterMetadata(self.obj, painter_postfix, painter_type)
 
     def _paint_fence(self):
         """Paints a fence tile for this object. Assumes that tag_PaintedFence exists."""
         if not self.tilecolor:
             self.tilecolor = self.color
-        if self.detail and self.detail == "k" and "^" in self.tilecolor:
-            # detail 'k' means trans layer is used for secondary color (common with fence tiles)
-            self.detail = "transparent"
-            self.trans = self.tilecolor.split("^")[1]
-            # remove ^ from tilecolor to prevent QudTile overriding trans
-            self.tilecolor = self.tilecolor.split("^")[0]
-        elif (self.detail is None or self.detail != "k") and "^" in self.tilecolor:
-            bgcolor = self.tilecolor.split("^")[1]
+        if "^" in self.tilecolor:
             # remove ^ from tilecolor to prevent QudTile overriding trans
-            self.tilecolor = self.tilecolor.split("^")[0]
-            self.trans = bgcolor if bgcolor != "k" else self.trans
+            self.tilecolor, _, bgcolor = self.tilecolor.partition("^")
+            if self.detail == "k":
+                # detail 'k' means trans layer is used for secondary color (common with fence tiles)
+                self.detail = "transparent"
+                self.trans = bgcolor
+            else:
+                self.trans = bgcolor if bgcolor != "k" else self.trans
         self.color = self.tilecolor
         _ = self.obj.tag_PaintedFenceAtlas_Value
         tileloc = _ if _ else "Tiles/"
@@ -229,22 +350,23 @@ class TilePainter:
                 powered = self.obj.part_HydraulicPowerTransmission_TileAppendWhenPowered
                 unbroken = self.obj.part_HydraulicPowerTransmission_TileAppendWhenUnbroken
                 if powered and unbroken:
-                    tilename = tilename + powered + unbroken
+                    tilename = f"{tilename}{powered}{unbroken}"
                 if not self.obj.part_HydraulicPowerTransmission_TileAnimateSuppressWhenUnbroken:
                     tilename += "_1"
         if self.obj.part_MechanicalPowerTransmission:
             if self.obj.part_MechanicalPowerTransmission_TileEffects == "true":
-                tilename = tilename + "_1"
-        self.file = tileloc + tilename + "_" + "nsew" + tileext
+                tilename += "_1"
+        self.file = f"{tileloc}{tilename}_nsew{tileext}"
 
     def _paint_wall(self):
         """Paints a wall tile for this object. Assumes that tag_PaintedWall exists."""
         wallcolor = self.tilecolor if self.tilecolor else self.color
-        if self.detail and self.detail == "k" and "^" in wallcolor:
-            self.detail = "transparent"
-            self.trans = wallcolor.split("^", 1)[1]
-        elif self.detail is None and "^" in wallcolor:
-            self.trans = wallcolor.split("^", 1)[1]
+        if "^" in wallcolor:
+            if self.detail == "k":
+                self.detail = "transparent"
+                self.trans = wallcolor.partition("^")[2]
+            elif self.detail is None:
+                self.trans = wallcolor.partition("^")[2]
         _ = self.obj.tag_PaintedWallAtlas_Value
         tileloc = _ if _ else "Tiles/"
         _ = self.obj.tag_PaintedWallExtension_Value
@@ -252,15 +374,14 @@ class TilePainter:
         if self.paintpath == "" or self.paintpath is None:
             self.file = None
         else:
-            self.file = tileloc + self.paintpath + "-00000000" + tileext
+            self.file = f"{tileloc}{self.paintpath}-00000000{tileext}"
 
     def _paint_walltrap(self):
         """Renders a walltrap tile. These are normally colored in the C# code, so we handle them
         specially."""
         warmcolor = self.obj.part_Walltrap_WarmColor
-        fore = extract_foreground_char(warmcolor, "r")
-        back = extract_background_char(warmcolor, "g")
-        self.color = "&" + fore + "^" + back
+        fore, back = extract_fore_back_chars(warmcolor, "r", "g")
+        self.color = _compose_walltrap_color(fore, back)
         self.tilecolor = self.color
         self.trans = back
         self.detail = "transparent"
@@ -272,47 +393,27 @@ class TilePainter:
         tileloc = "Water/"  # there is no support for a PaintedLiquidAtlas tag, it's always 'Water/'
         ext = self.obj.tag_PaintedLiquidExtension_Value
         tileext = ext if ext else ".bmp"
-        return tileloc + self.obj.tag_PaintedLiquid_Value + "-00000000" + tileext
+        return f"{tileloc}{self.obj.tag_PaintedLiquid_Value}-00000000{tileext}"
 
     def paint_harvestable(self, is_ripe: bool) -> None:
         """Renders either the ripe or the unripe variant for an object with the Harvestable part."""
         if is_ripe:
-            ripe_color = self.obj.part_Harvestable_RipeColor
-            self.color = self.color if ripe_color is None else ripe_color
-            ripe_tilecolor = self.obj.part_Harvestable_RipeTileColor
-            self.tilecolor = self.tilecolor if ripe_tilecolor is None else ripe_tilecolor
-            ripe_detail = self.obj.part_Harvestable_RipeDetailColor
-            self.detail = self.detail if ripe_detail is None else ripe_detail
+            self.color = self.obj.part_Harvestable_RipeColor or self.color
+            self.tilecolor = self.obj.part_Harvestable_RipeTileColor or self.tilecolor
+            self.detail = self.obj.part_Harvestable_RipeDetailColor or self.detail
         else:
-            unripe_color = self.obj.part_Harvestable_UnripeColor
-            self.color = self.color if unripe_color is None else unripe_color
-            unripe_tilecolor = self.obj.part_Harvestable_UnripeTileColor
-            self.tilecolor = self.tilecolor if unripe_tilecolor is None else unripe_tilecolor
-            unripe_detail = self.obj.part_Harvestable_UnripeDetailColor
-            self.detail = self.detail if unripe_detail is None else unripe_detail
+            self.color = self.obj.part_Harvestable_UnripeColor or self.color
+            self.tilecolor = self.obj.part_Harvestable_UnripeTileColor or self.tilecolor
+            self.detail = self.obj.part_Harvestable_UnripeDetailColor or self.detail
 
     def paint_aloe(self, is_ready: bool) -> None:
         """Renders either the 'Ready' or the 'Cooldown' variant of an aloe plant."""
-        if is_ready:
-            if self.obj.part_DischargeOnStep is not None:  # Aloe Volta
-                self.color = self.tilecolor = "&W"
-                self.detail = "w"
-            elif self.obj.part_CrossFlameOnStep is not None:  # Aloe Pyra
-                self.color = self.tilecolor = "&W"
-                self.detail = "R"
-            elif self.obj.part_FugueOnStep is not None:  # Aloe Fugues
-                self.color = self.tilecolor = "&G"
-                self.detail = "M"
-        else:
-            if self.obj.part_DischargeOnStep is not None:
-                self.color = self.tilecolor = "&w"
-                self.detail = "w"
-            elif self.obj.part_CrossFlameOnStep is not None:
-                self.color = self.tilecolor = "&w"
-                self.detail = "r"
-            elif self.obj.part_FugueOnStep is not None:
-                self.color = self.tilecolor = "&g"
-                self.detail = "m"
+        flags = self.paint_flags
+        for aloe_flag, (ready_colors, cooldown_colors) in ALOE_COLORS.items():
+            if flags & aloe_flag:
+                color, self.detail = ready_colors if is_ready else cooldown_colors
+                self.color = self.tilecolor = color
+                return
 
     def paint_door(self, is_closed: bool = False, double_door_alt: bool = False) -> None:
         if is_closed:
@@ -361,11 +462,12 @@ class TilePainter:
             self._invert_filename_direction()
 
     def _invert_filename_direction(self) -> bool:
-        start_dirs = ["_w_", "_w.", "_e_", "_e."]
-        transform_dirs = ["_e_", "_e.", "_w_", "_w."]
-        for dir1, dir2 in zip(start_dirs, transform_dirs):
-            if dir1 in self.file:
-                self.file = self.file.replace(dir1, dir2)
+        """Swaps the west/east direction marker ('_w_', '_w.', '_e_' or '_e.') in this tile's
+        filepath. Only the first of those markers that the filepath contains is swapped. Returns
+        True if the filepath contained a direction marker."""
+        for marker, flipped in DIRECTION_SWAPS:
+            if marker in self.file:
+                self.file = self.file.replace(marker, flipped)
                 return True
         return False
 
@@ -374,7 +476,7 @@ class TilePainter:
         """Accepts a value from part_PaintedFence_Value or part_PaintedWall_Value, and retrieves
         the tile that should be used for that painted fence or wall. Rarely, these parts have a
         comma delimited list of possible tiles that can be used."""
-        return path.split(",")[0]
+        return path.partition(",")[0]
 
     @staticmethod
     def is_painted_fence(qud_object) -> bool:
@@ -384,16 +486,53 @@ class TilePainter:
             and qud_object.tag_PaintedFence_Value != "*delete"
         )
 
+    @property
+    def paint_flags(self) -> int:
+        """Bit flags (PAINT_* constants) describing the parts and ancestry of this object that
+        affect how it is painted. Evaluated once and shared by the painter and its styles."""
+        if self._paint_flags is None:
+            obj = self.obj
+            flags = 0
+            if any(obj.is_specified(part) for part in HOLO_PARTS):
+                flags |= PAINT_HOLOGRAM
+            if obj.part_DischargeOnStep is not None:
+                flags |= PAINT_ALOE_DISCHARGE
+            if obj.part_CrossFlameOnStep is not None:
+                flags |= PAINT_ALOE_CROSSFLAME
+            if obj.part_FugueOnStep is not None:
+                flags |= PAINT_ALOE_FUGUE
+            if obj.part_Door is not None and obj.inherits_from("Double Door"):
+                flags |= PAINT_DOUBLE_DOOR
+            if obj.part_DoubleEnclosing is not None:
+                flags |= PAINT_DOUBLE_ENCLOSING
+            self._paint_flags = flags
+        return self._paint_flags
+
     def tile_count(self) -> int:
         """Retrieves the total number of tiles that are available for this object. Some objects have
-        alternate tiles."""
-        if not self.obj.has_tile():
-            return 0
-        count = self._style_manager.style_count()
-        return count if count > 0 else 1
+        alternate tiles. The count never changes for an object, so it is cached after the first
+        call."""
+        if self._tile_count is None:
+            if not self.obj.has_tile():
+                self._tile_count = 0
+            else:
+                count = self._style_manager.style_count()
+                self._tile_count = count if count > 0 else 1
+        return self._tile_count
+
+
+def paint_all(qud_objects: Iterable) -> Iterator[Tuple[Any, List[QudTile], List]]:
+    """Paints every tile variation for each of the provided QudObjects, yielding tuples of
+    (QudObject, list of QudTiles, list of TilePainterMetadata). These are the same lists returned by
+    each object's tiles_and_metadata(), so objects without tiles yield empty lists and objects that
+    have already been painted are not painted again."""
+    for qud_object in qud_objects:
+        yield (qud_object, *qud_object.tiles_and_metadata())
 
 
 class TilePainterMetadata:
+    __slots__ = ("postfix", "type", "obj_id", "_base_filename", "_file_noex", "_has_gif")
+
     def __init__(self, qud_object, postfix, tiletype):
         """Stores basic metadata for a tile, such as the filename that should be used for saving
         the tile as well as the type of tile, such as 'harvestable' or 'random sprite #7'."""
@@ -402,7 +541,6 @@ class TilePainterMetadata:
         self.obj_id = qud_object.name
         self._base_filename = qud_object.image
         self._file_noex = None
-        self._file = None
         self._has_gif = qud_object.has_gif_tile()
 
     def is_animated(self):
@@ -422,15 +560,15 @@ class TilePainterMetadata:
         return self._filename_noextension() + " animated.gif"
 
     def _filename_noextension(self) -> str:
-        """The recommended base filename with no extension."""
+        """The recommended base filename with no extension. Cached after the first call."""
         if self._file_noex is None:
             if self._base_filename is None or self._base_filename == "none":
                 raise Exception(f'Error: tile for "{self.obj_id}" does not have a filename.')
-            self._base_filename = os.path.splitext(self._base_filename)[0]
+            base_filename = os.path.splitext(self._base_filename)[0]
             if self.postfix is None:
-                self._file_noex = self._base_filename
+                self._file_noex = base_filename
             else:
-                self._file_noex = self._base_filename + self.postfix
+                self._file_noex = base_filename + self.postfix
         return self._file_noex
 
 
@@ -3,21 +3,50 @@ from __future__ import annotations  # allow forward type references
 import itertools
 import os
 import random
-from enum import Flag, auto
-from typing import List, Optional, Type, Tuple
+import re
+from enum import IntFlag, auto
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Dict, Iterator, List, Optional, Type, Tuple
+from weakref import WeakKeyDictionary
 
 from hagadias.constants import LIQUID_COLORS
-from hagadias.dicebag import DiceBag
 from hagadias.helpers import (
-    obj_has_any_part,
     extract_foreground_char,
     int_or_default,
     extract_background_char,
 )
 
+DIRECTION_MARKER_PATTERN = re.compile(r"_([we])([_.])")  # west/east markers in tile filepaths
+CLOSURE_DESCRIPTORS = {
+    # (is_closed, direction marker): metadata type for doors and enclosures
+    (True, None): "closed",
+    (False, None): "open",
+    (True, "w"): "closed (west)",
+    (False, "w"): "open (west)",
+    (True, "e"): "closed (east)",
+    (False, "e"): "open (east)",
+}
+DIRECTION_DESCRIPTORS = {"w": "(west)", "e": "(east)"}
 
-class RenderProps(Flag):
-    """Bit flags that represent the render properties which styles may modify."""
+
+# direction markers in tile filepaths, in the order they are checked (west before east)
+DIRECTION_MARKERS = {"w": ("_w_", "_w."), "e": ("_e_", "_e.")}
+SUFFIX_DIRECTION_MARKERS = {"w": ("_w.",), "e": ("_e.",)}  # markers before the file extension
+
+
+def _marked_direction(path: str, markers: Dict[str, Tuple[str, ...]]) -> Optional[str]:
+    """Returns the direction ('w' or 'e') marked in a tile filepath, or None if it has no direction
+    marker. A filepath that has markers for both directions is treated as west."""
+    for direction, direction_markers in markers.items():
+        if any(marker in path for marker in direction_markers):
+            return direction
+    return None
+
+
+class RenderProps(IntFlag):
+    """Bit flags that represent the render properties which styles may modify. TileStyle stores
+    these as plain ints, so that scope checks are integer operations rather than enum operations."""
 
     NONE = 0
     FILE = auto()  # Tile filepath
@@ -29,7 +58,29 @@ class RenderProps(Flag):
     ALL = FILE | COLOR | DETAIL | TRANS
 
 
+# Bit flags for the parts and ancestry of an object that affect how it is painted. These are
+# evaluated once per object and exposed through TilePainter.paint_flags.
+PAINT_HOLOGRAM = 1 << 0
+PAINT_ALOE_DISCHARGE = 1 << 1  # Aloe Volta
+PAINT_ALOE_CROSSFLAME = 1 << 2  # Aloe Pyra
+PAINT_ALOE_FUGUE = 1 << 3  # Aloe Fugues
+PAINT_DOUBLE_DOOR = 1 << 4
+PAINT_DOUBLE_ENCLOSING = 1 << 5
+PAINT_ALOE = PAINT_ALOE_DISCHARGE | PAINT_ALOE_CROSSFLAME | PAINT_ALOE_FUGUE
+
+
 class StyleMetadata:
+    __slots__ = (
+        "merged_types",
+        "merged_types_after",
+        "merged_postfixes",
+        "meta_type_after",
+        "meta_type",
+        "f_postfix",
+        "_type_cache",
+        "_postfix_cache",
+    )
+
     def __init__(self, meta_type: str = "", f_postfix: str = None, meta_type_after: bool = False):
         """A style metadata object that defines the type of tile and recommended file postfix.
 
@@ -51,6 +102,8 @@ class StyleMetadata:
         self.meta_type_after = meta_type_after
         self.meta_type = meta_type
         self.f_postfix = f_postfix if f_postfix is not None else meta_type
+        self._type_cache: Optional[str] = None
+        self._postfix_cache: Optional[str] = None
 
     def merge_with(self, mdata_to_merge: StyleMetadata):
         """Accepts another StyleMetadata instance and merges it's metadata into this instance.
@@ -64,47 +117,63 @@ class StyleMetadata:
         else:
             self.merged_types.append(mdata_to_merge.meta_type)
         self.merged_postfixes.append(mdata_to_merge.f_postfix)
+        self._type_cache = self._postfix_cache = None
 
     @property
     def type(self) -> str:
         """The descriptive metadata label for this tile (example: 'ripe, random sprite #2')"""
-        if len("".join(self.merged_types)) == 0 and len("".join(self.merged_types_after)) == 0:
+        if self._type_cache is None:
+            self._type_cache = self._compose_type()
+        return self._type_cache
+
+    def _compose_type(self) -> str:
+        """Combines this metadata's type with the types of any merged metadata."""
+        if not any(self.merged_types) and not any(self.merged_types_after):
             if self.meta_type is not None:
                 return self.meta_type.strip()
             return ""
+        meta_type = self.meta_type.strip()
         merged_types = " ".join(self.merged_types).strip()
         merged_types_after = " ".join(self.merged_types_after).strip()
-        if self.meta_type_after and len(self.meta_type.strip()) > 0:
-            composite_merged_types = f"{merged_types} {merged_types_after}".strip()
-            composed = f"{composite_merged_types}, {self.meta_type.strip()}"
-        else:
-            composed = f"{self.meta_type.strip()} {merged_types}"
-            if len(merged_types_after) > 0:
-                composed = composed.strip()
-                if len(composed) > 0:
-                    composed = f"{composed.strip()}, {merged_types_after}"
-                else:
-                    composed = merged_types_after
-        return composed.strip()
+        if self.meta_type_after and len(meta_type) > 0:
+            composite_merged_types = " ".join(filter(None, (merged_types, merged_types_after)))
+            return f"{composite_merged_types}, {meta_type}"
+        composed = " ".join(filter(None, (meta_type, merged_types)))
+        if len(merged_types_after) > 0:
+            composed = f"{composed}, {merged_types_after}" if composed else merged_types_after
+        return composed
 
     @property
     def postfix(self) -> str:
         """The recommended filename postfix for this tile (example: ' variation 1 ripe')"""
+        if self._postfix_cache is None:
+            self._postfix_cache = self._compose_postfix()
+        return self._postfix_cache
+
+    def _compose_postfix(self) -> str:
+        """Combines this metadata's postfix with the postfixes of any merged metadata."""
         if len(self.merged_postfixes) == 0:
-            if self.f_postfix is not None and len(self.f_postfix.strip()) > 0:
+            if self.f_postfix and not self.f_postfix.isspace():
                 return f" {self.f_postfix.strip()}"
             return ""
-        merged_postfixes = " ".join(self.merged_postfixes).strip()
-        final_postfix = f"{self.f_postfix.strip()} {merged_postfixes}"
-        if len(final_postfix.strip()) > 0:
-            # condense any consecutive spaces to a single space
-            final_postfix = " ".join(final_postfix.split())
-            final_postfix = final_postfix.strip()
-            return f" {final_postfix}"
-        return ""
+        # condense any consecutive spaces to a single space
+        final_postfix = " ".join(" ".join([self.f_postfix, *self.merged_postfixes]).split())
+        return f" {final_postfix}" if final_postfix else ""
 
 
 class TileStyle:
+    __slots__ = ("painter", "object", "priority", "_modifies", "_allows", "_count_cache")
+
+    TRIGGERS: Tuple[str, ...] = ()
+    """QudObject attributes (such as 'part_Door') of which at least one must be present for this
+    style to be applicable. StyleManager skips constructing a style when none of them are present.
+    Styles that can't be prefiltered by attribute leave this empty."""
+
+    TRIGGER_NAMES: Tuple[str, ...] = ()
+    """Object names for styles that only apply to specific objects. The style is considered for an
+    object with one of these names, or one that directly inherits from one of them. Styles that
+    also have TRIGGERS are considered if either one matches."""
+
     def __init__(
         self,
         _painter,  # Type: TilePainter
@@ -123,43 +192,40 @@ class TileStyle:
                 accept further modifications after this style has been applied. Properties not
                 specified here can no longer be modified by further styles on the style stack.
         """
-        self._painter = _painter
-        self._priority = _priority
-        self._modifies = _modifies
-        self._allows = _allows
-
-    @property
-    def object(self):
-        return self._painter.obj  # Type: QudObject
-
-    @property
-    def painter(self):
-        return self._painter  # Type: TilePainter
-
-    @property
-    def priority(self) -> int:
-        return self._priority
+        self.painter = _painter  # Type: TilePainter
+        self.object = _painter.obj  # Type: QudObject
+        self.priority = _priority
+        self._modifies = int(_modifies)
+        self._allows = int(_allows)
+        self._count_cache: Optional[int] = None
 
     @property
     def modifies(self) -> RenderProps:
-        return self._modifies
+        return RenderProps(self._modifies)
 
     @property
     def allows(self) -> RenderProps:
-        return self._allows
+        return RenderProps(self._allows)
 
     @property
     def is_applicable(self) -> bool:
-        return self._modification_count() > 0
+        return self._cached_modification_count() > 0
 
     def modifies_within_scope(self, allowed_scope: RenderProps) -> bool:
         """True if this style modifies only the specified RenderProps."""
-        return self._modifies & allowed_scope == self._modifies
+        return self._modifies & ~int(allowed_scope) == 0
 
     def modification_count(self) -> int:
         """Number of style permutations this style can contribute to the underlying object.
         Returns 0 if this style isn't applicable."""
-        return self._modification_count()
+        return self._cached_modification_count()
+
+    def _cached_modification_count(self) -> int:
+        """Returns the result of _modification_count(), which is only evaluated once. A style is
+        bound to a single painter and object whose parts don't change while it is styled."""
+        if self._count_cache is None:
+            self._count_cache = self._modification_count()
+        return self._count_cache
 
     def _modification_count(self) -> int:
         """Returns the number of style permutations that this style can contribute to the
@@ -175,7 +241,7 @@ class TileStyle:
         Args:
             index: The zero-based style modification index.
         """
-        if index >= self._modification_count():  # retrieve count from child implementation
+        if index >= self._cached_modification_count():  # count from child implementation
             raise RuntimeError(f"{self.__class__.__name__} index overlow.")
         return self._apply_modification(index)
 
@@ -204,7 +270,10 @@ class TileStyle:
 class StyleSultanMuralWall(TileStyle):
     """Styles for SultanMuralWall<1-6> (wall 6 is the player's murals etched by Herododicus)."""
 
-    MURAL_LABELS = [
+    __slots__ = ()
+    TRIGGERS = ("part_SultanMural",)
+
+    MURAL_LABELS = (
         "appeases baetyl",
         "becomes loved",
         "blank",
@@ -238,8 +307,8 @@ class StyleSultanMuralWall(TileStyle):
         "visits location",
         "weird thing happens",
         "wields item in battle",
-    ]
-    MURAL_PATHS = [
+    )
+    MURAL_PATHS = (
         "appeasesbaetyl",
         "becomesloved",
         "blank",
@@ -273,8 +342,13 @@ class StyleSultanMuralWall(TileStyle):
         "visitslocation",
         "weirdthinghappens",
         "wieldsiteminbattle",
-    ]
-    MURAL_POSITIONS = ["l", "c", "r"]
+    )
+    MURAL_POSITIONS = ("l", "c", "r")
+    MURAL_ENTRIES = tuple(
+        # (tile path, metadata type, filename postfix) for each mural type and position
+        (f"Walls/sw_mural_{path}_{pos}.bmp", f"{label} {pos.upper()}", f"{path}_{pos}")
+        for (path, label), pos in itertools.product(zip(MURAL_PATHS, MURAL_LABELS), MURAL_POSITIONS)
+    )
 
     def __init__(self, _painter):
         super().__init__(
@@ -283,27 +357,26 @@ class StyleSultanMuralWall(TileStyle):
 
     def _modification_count(self) -> int:
         if self.object.part_SultanMural is not None:
-            return len(StyleSultanMuralWall.MURAL_PATHS) * 3
+            return len(StyleSultanMuralWall.MURAL_ENTRIES)
         return 0
 
     def _apply_modification(self, index: int) -> StyleMetadata:
-        mural_type = StyleSultanMuralWall.MURAL_PATHS[index // 3]
-        mural_label = StyleSultanMuralWall.MURAL_LABELS[index // 3]
-        mural_pos = StyleSultanMuralWall.MURAL_POSITIONS[index % 3]
-        self.painter.file = f"Walls/sw_mural_{mural_type}_{mural_pos}.bmp"
-        return StyleMetadata(
-            meta_type=f"{mural_label} {mural_pos.upper()}", f_postfix=f"{mural_type}_{mural_pos}"
-        )
+        file, meta_type, postfix = StyleSultanMuralWall.MURAL_ENTRIES[index]
+        self.painter.file = file
+        return StyleMetadata(meta_type=meta_type, f_postfix=postfix)
 
     def style_limit_override(self) -> Optional[int]:
-        return len(StyleSultanMuralWall.MURAL_PATHS) * 3
+        return len(StyleSultanMuralWall.MURAL_ENTRIES)
 
 
 class StyleSultanMuralMedian(TileStyle):
     """Styles for sultan mural medians."""
 
-    MURAL_MEDIAN_COLOR = ["C", "m", "M", "r", "c", "K"]
-    MURAL_MEDIAN_DETAIL = ["K", "y", "r", "c", "Y", "y"]
+    __slots__ = ()
+    TRIGGER_NAMES = ("BaseMuralCenter",)
+
+    MURAL_MEDIAN_COLOR = ("C", "m", "M", "r", "c", "K")
+    MURAL_MEDIAN_DETAIL = ("K", "y", "r", "c", "Y", "y")
 
     def __init__(self, _painter):
         super().__init__(
@@ -316,11 +389,12 @@ class StyleSultanMuralMedian(TileStyle):
         return 0
 
     def _apply_modification(self, index: int) -> StyleMetadata:
-        self.painter.color = StyleSultanMuralMedian.MURAL_MEDIAN_COLOR[index]
-        self.painter.tilecolor = StyleSultanMuralMedian.MURAL_MEDIAN_COLOR[index]
-        self.painter.detail = StyleSultanMuralMedian.MURAL_MEDIAN_DETAIL[index]
-        self.painter.trans = "k"
-        self.painter.file = f"Walls/sw_mural_centerpiece_period_{index + 1}.bmp"
+        painter = self.painter
+        painter.color = StyleSultanMuralMedian.MURAL_MEDIAN_COLOR[index]
+        painter.tilecolor = StyleSultanMuralMedian.MURAL_MEDIAN_COLOR[index]
+        painter.detail = StyleSultanMuralMedian.MURAL_MEDIAN_DETAIL[index]
+        painter.trans = "k"
+        painter.file = f"Walls/sw_mural_centerpiece_period_{index + 1}.bmp"
         return StyleMetadata(
             meta_type=f"period {index + 1} sultanate", f_postfix=f"period {index + 1}"
         )
@@ -329,8 +403,11 @@ class StyleSultanMuralMedian(TileStyle):
 class StyleSultanMuralEndcap(TileStyle):
     """Styles for sultan mural endcaps."""
 
-    MURAL_ENDCAP_COLOR = ["C", "m", "M", "r", "c", "K"]
-    MURAL_ENDCAP_DETAIL = ["K", "y", "r", "c", "Y", "y"]
+    __slots__ = ()
+    TRIGGER_NAMES = ("BaseMuralLeftend",)
+
+    MURAL_ENDCAP_COLOR = ("C", "m", "M", "r", "c", "K")
+    MURAL_ENDCAP_DETAIL = ("K", "y", "r", "c", "Y", "y")
 
     def __init__(self, _painter):
         super().__init__(
@@ -343,14 +420,15 @@ class StyleSultanMuralEndcap(TileStyle):
         return 0
 
     def _apply_modification(self, index: int) -> StyleMetadata:
+        painter = self.painter
         color_idx = index // 2
         period = index // 2 + 1
-        self.painter.color = StyleSultanMuralEndcap.MURAL_ENDCAP_COLOR[color_idx]
-        self.painter.tilecolor = StyleSultanMuralEndcap.MURAL_ENDCAP_COLOR[color_idx]
-        self.painter.detail = StyleSultanMuralEndcap.MURAL_ENDCAP_DETAIL[color_idx]
-        self.painter.trans = "k"
+        painter.color = StyleSultanMuralEndcap.MURAL_ENDCAP_COLOR[color_idx]
+        painter.tilecolor = StyleSultanMuralEndcap.MURAL_ENDCAP_COLOR[color_idx]
+        painter.detail = StyleSultanMuralEndcap.MURAL_ENDCAP_DETAIL[color_idx]
+        painter.trans = "k"
         orientation = "left" if (index % 2 == 0) else "right"
-        self.painter.file = f"Walls/sw_mural_{orientation}end_period_{period}.bmp"
+        painter.file = f"Walls/sw_mural_{orientation}end_period_{period}.bmp"
         return StyleMetadata(
             meta_type=f"period {period} sultanate ({orientation})",
             f_postfix=f"period {period} {orientation}end",
@@ -360,7 +438,11 @@ class StyleSultanMuralEndcap(TileStyle):
 class StyleRandomColors(TileStyle):
     """Styles for the RandomColors part."""
 
+    __slots__ = ("_count", "_pairs", "_maincolors", "_detailcolors", "_tilecolors", "_bgcolors")
+    TRIGGERS = ("part_RandomColors",)
+
     RANDOM_COLORS_ALL = "R,W,G,B,M,C,Y,r,w,g,b,m,c,y"
+    RANDOM_COLORS_ALL_SPLIT = tuple(RANDOM_COLORS_ALL.split(","))
     INDEX_MULTIPLIER = {"Bouquet": 5, "Flower": 6, "Flowers": 5}
     INDEX_OFFSET = {"Bouquet": 0, "Flower": 1, "Flowers": 2}
 
@@ -384,98 +466,122 @@ class StyleRandomColors(TileStyle):
                 maincolors = maincolors.split(",")
                 detailcolors = detailcolors.split(",")
             else:
-                # Filter out duplicates by temporary conversion to a set
-                maincolors = [None] if maincolors is None else list(set(maincolors.split(",")))
-                detailcolors = (
-                    [None] if detailcolors is None else list(set(detailcolors.split(",")))
-                )
-            tilecolors = [None] if tilecolors is None else list(set(tilecolors.split(",")))
-            bgcolors = [None] if bgcolors is None else list(set(bgcolors.split(",")))
-            # Sort and then shuffle using Object ID as seed, to always get the same result
-            random.seed(self.object.name)
-            if not pairmaindetail:
-                maincolors.sort()
-                random.shuffle(maincolors)
-                detailcolors.sort()
-                random.shuffle(detailcolors)
-            tilecolors.sort()
-            random.shuffle(tilecolors)
-            bgcolors.sort()
-            random.shuffle(bgcolors)
-            # Generate unique combinations
+                maincolors = self._unique_colors(maincolors)
+                detailcolors = self._unique_colors(detailcolors)
+            tilecolors = self._unique_colors(tilecolors)
+            bgcolors = self._unique_colors(bgcolors)
+            # Shuffle using Object ID as seed, to always get the same result
+            rng = random.Random(self.object.name)
+            pools = [tilecolors, bgcolors]
             if not pairmaindetail:
-                self._combos = list(
-                    itertools.product(*[maincolors, detailcolors, tilecolors, bgcolors])
-                )
-            else:
-                self._combos = []
-                for mc, dc in zip(maincolors, detailcolors):
-                    for tc in tilecolors:
-                        for bc in bgcolors:
-                            self._combos.append((mc, dc, tc, bc))
+                pools = [maincolors, detailcolors, *pools]
+            for pool in pools:
+                rng.shuffle(pool)
+            # Combinations are decoded from a flat index on demand rather than materialized;
+            # paired main/detail colors form a single axis
+            self._pairs = list(zip(maincolors, detailcolors)) if pairmaindetail else None
+            self._maincolors, self._detailcolors = maincolors, detailcolors
+            self._tilecolors, self._bgcolors = tilecolors, bgcolors
             # Update count
-            self._count = len(self._combos)
+            if pairmaindetail:
+                maindetail_count = len(self._pairs)
+            else:
+                maindetail_count = len(maincolors) * len(detailcolors)
+            self._count = maindetail_count * len(tilecolors) * len(bgcolors)
+
+    @staticmethod
+    def _unique_colors(colors: str | None) -> List[str | None]:
+        """Splits a comma-separated color list and filters out duplicates. The result is sorted so
+        that the seeded shuffle applied to it is deterministic."""
+        return [None] if colors is None else sorted(dict.fromkeys(colors.split(",")))
+
+    def _combo(self, colorindex: int) -> Tuple[str | None, str | None, str | None, str | None]:
+        """Returns the (main, detail, tile, background) colors at the given combination index, in
+        the same order that itertools.product would have generated them."""
+        rest, bi = divmod(colorindex, len(self._bgcolors))
+        rest, ti = divmod(rest, len(self._tilecolors))
+        if self._pairs is not None:
+            maincolor, detailcolor = self._pairs[rest]
+        else:
+            mi, di = divmod(rest, len(self._detailcolors))
+            maincolor, detailcolor = self._maincolors[mi], self._detailcolors[di]
+        return maincolor, detailcolor, self._tilecolors[ti], self._bgcolors[bi]
 
     def _modification_count(self) -> int:
         return self._count
 
     def _apply_modification(self, index: int) -> StyleMetadata:
-        if self.object.name in self.INDEX_MULTIPLIER:
+        painter = self.painter
+        name = self.object.name
+        if name in self.INDEX_MULTIPLIER:
             # Special indexing for tiles with a lot of variations - this better shows off the color
             # variety of the tile, rather than repeating the same colors many times while we iterate
             # over other styles (like RandomTile)
-            colorindex = (
-                index * self.INDEX_MULTIPLIER[self.object.name]
-                + self.INDEX_OFFSET[self.object.name]
-            )
+            colorindex = index * self.INDEX_MULTIPLIER[name] + self.INDEX_OFFSET[name]
         else:
             colorindex = index
-        maincolor, detailcolor, tilecolor, bgcolor = self._combos[colorindex]
+        combo = self._combo(colorindex)
+        maincolor, detailcolor, tilecolor, bgcolor = combo
         if bgcolor is None:
-            bgcolor = extract_background_char(self.painter.color)
+            bgcolor = extract_background_char(painter.color)
             if bgcolor is None:
-                bgcolor = extract_background_char(self.painter.tilecolor)
+                bgcolor = extract_background_char(painter.tilecolor)
         if maincolor is not None:
-            self.painter.color = self.painter.tilecolor = maincolor
+            painter.color = painter.tilecolor = maincolor
         if tilecolor is not None:
-            self.painter.tilecolor = tilecolor
+            painter.tilecolor = tilecolor
         if bgcolor is not None:
-            self.painter.trans = bgcolor
+            painter.trans = bgcolor
         if detailcolor is not None:
-            self.painter.detail = detailcolor
-        pfix = "".join([(c if c is not None else "_") for c in self._combos[colorindex]])
+            painter.detail = detailcolor
+        pfix = "".join([(c if c is not None else "_") for c in combo])
         return StyleMetadata(
             meta_type=f"color #{index + 1}", f_postfix=f" (colors {pfix})", meta_type_after=True
         )
 
 
+@lru_cache(maxsize=None)
+def _village_monument_combos(name: str) -> Tuple[str, ...]:
+    """Returns 30 unique foreground/detail color pairs for the specified village monument, randomly
+    sampled using the object name as the seed."""
+    # seeded private generator; draws the same samples as the module-level generator would after
+    # random.seed(), without having to save and restore its global state
+    rng = random.Random(name)
+    combos = []
+    seen = set()
+    while len(combos) < 30:
+        vals = rng.sample(StyleRandomColors.RANDOM_COLORS_ALL_SPLIT, 2)
+        colors = f"{vals[0]}{vals[1]}"
+        if colors not in seen:
+            seen.add(colors)
+            combos.append(colors)
+    return tuple(combos)
+
+
 class StyleVillageMonument(TileStyle):
     """Styles for village monuments. This style includes only 30 sample color combinations, randomly
     seeded from the ObjectBluprint name. In game, these objects have closer to 100 variations."""
 
+    __slots__ = ("_color_combos",)
+    TRIGGER_NAMES = ("Village Monument",)
+
     def __init__(self, _painter):
         super().__init__(
             _painter, _priority=100, _modifies=RenderProps.COLORS, _allows=RenderProps.FILE
         )
-        self._color_combos = []
+        self._color_combos: Tuple[str, ...] = ()
         if self.object.inheritingfrom == "Village Monument":
-            preserved_state = random.getstate()
-            random.seed(self.object.name)
-            while len(self._color_combos) < 30:
-                vals = random.sample(StyleRandomColors.RANDOM_COLORS_ALL.split(","), 2)
-                colors = f"{vals[0]}{vals[1]}"
-                if colors not in self._color_combos:
-                    self._color_combos.append(colors)
-            random.setstate(preserved_state)
+            self._color_combos = _village_monument_combos(self.object.name)
 
     def _modification_count(self) -> int:
         return len(self._color_combos)
 
     def _apply_modification(self, index: int) -> StyleMetadata:
-        self.painter.color = self._color_combos[index][0]
-        self.painter.tilecolor = self._color_combos[index][0]
-        self.painter.trans = "transparent"
-        self.painter.detail = self._color_combos[index][1]
+        painter = self.painter
+        painter.color = self._color_combos[index][0]
+        painter.tilecolor = self._color_combos[index][0]
+        painter.trans = "transparent"
+        painter.detail = self._color_combos[index][1]
         return StyleMetadata(
             meta_type=f"sample colors #{index + 1}",
             f_postfix=f"coloration {index + 1}" if index > 0 else "",
@@ -486,16 +592,17 @@ class StyleVillageMonument(TileStyle):
 class StyleRandomTile(TileStyle):
     """Styles for the RandomTile part."""
 
+    __slots__ = ("_tiles",)
+    TRIGGERS = ("builder_RandomTile",)
+
     def __init__(self, _painter):
         super().__init__(
             _painter, _priority=30, _modifies=RenderProps.FILE, _allows=RenderProps.NONFILE
         )
-        random_tiles = self.object.builder_RandomTile_Tiles
-        self._tiles = [] if random_tiles is None else random_tiles.split(",")
+        # painted liquids handle their RandomTile sprites in StyleLiquidVolume instead
+        self._tiles = self.painter.random_tiles if self.object.tag_PaintedLiquid is None else ()
 
     def _modification_count(self) -> int:
-        if len(self._tiles) == 0 or self.object.tag_PaintedLiquid is not None:
-            return 0
         return len(self._tiles)
 
     def _apply_modification(self, index: int) -> StyleMetadata:
@@ -510,6 +617,15 @@ class StyleRandomTile(TileStyle):
 class StyleFracti(TileStyle):
     """Styles for the RandomTile builder."""
 
+    __slots__ = ()
+    TRIGGERS = ("part_Fracti",)
+
+    STATES = tuple(
+        # (tile path, metadata type, filename postfix)
+        (f"Terrain/sw_fracti{i + 1}.bmp", f"random sprite #{i + 1}", f"variation {i}" if i else "")
+        for i in range(8)
+    )
+
     def __init__(self, _painter):
         super().__init__(
             _painter, _priority=30, _modifies=RenderProps.FILE, _allows=RenderProps.NONFILE
@@ -519,17 +635,26 @@ class StyleFracti(TileStyle):
         return 8 if self.object.part_Fracti is not None else 0
 
     def _apply_modification(self, index: int) -> StyleMetadata:
-        self.painter.file = f"Terrain/sw_fracti{index + 1}.bmp"
-        return StyleMetadata(
-            meta_type=f"random sprite #{index + 1}",
-            f_postfix=f"variation {index}" if index > 0 else "",
-            meta_type_after=True,
-        )
+        self.painter.file, meta_type, postfix = StyleFracti.STATES[index]
+        return StyleMetadata(meta_type=meta_type, f_postfix=postfix, meta_type_after=True)
 
 
 class StyleTombstone(TileStyle):
     """Styles for the Tombstone part."""
 
+    __slots__ = ()
+    TRIGGERS = ("part_Tombstone", "part_RachelsTombstone")
+
+    STATES = tuple(
+        # (tile path, metadata type, filename postfix)
+        (
+            f"Terrain/sw_tombstone_{i + 1}.bmp",
+            f"random sprite #{i + 1}",
+            f"variation {i + 1}" if i else "",
+        )
+        for i in range(4)
+    )
+
     def __init__(self, _painter):
         super().__init__(
             _painter, _priority=30, _modifies=RenderProps.FILE, _allows=RenderProps.NONFILE
@@ -544,12 +669,8 @@ class StyleTombstone(TileStyle):
         )
 
     def _apply_modification(self, index: int) -> StyleMetadata:
-        self.painter.file = f"Terrain/sw_tombstone_{index + 1}.bmp"
-        return StyleMetadata(
-            meta_type=f"random sprite #{index + 1}",
-            f_postfix=f"variation {index + 1}" if index > 0 else "",
-            meta_type_after=True,
-        )
+        self.painter.file, meta_type, postfix = StyleTombstone.STATES[index]
+        return StyleMetadata(meta_type=meta_type, f_postfix=postfix, meta_type_after=True)
 
 
 class StyleLiquidVolume(TileStyle):
@@ -560,42 +681,45 @@ class StyleLiquidVolume(TileStyle):
     Technically liquid pools are painted if >= 200 drams, but otherwise use RandomTile. However,
     we'll include both tile possibilities in this single style."""
 
+    __slots__ = ("_tiles", "_detail", "_tilecolor")
+    TRIGGERS = ("part_LiquidVolume",)
+
     def __init__(self, _painter):
         super().__init__(
             _painter, _priority=90, _modifies=RenderProps.ALL, _allows=RenderProps.NONE
         )
-        self._tiles = []
-        self._liquids: Optional[List[str]] = None
-        if self.object.part_LiquidVolume is not None:
-            if self.object.part_LiquidVolume_MaxVolume == "-1":
-                liquids: str = self.object.part_LiquidVolume_InitialLiquid
+        self._tiles: Tuple[str, ...] = ()
+        self._detail: Optional[str] = None
+        self._tilecolor: Optional[str] = None
+        liquid_volume = self.object.part_LiquidVolume
+        if liquid_volume is not None:
+            if liquid_volume.get("MaxVolume") == "-1":
+                liquids: str = liquid_volume.get("InitialLiquid")
                 if liquids is not None and len(liquids) > 0:
-                    start_volume = self.object.part_LiquidVolume_StartVolume
-                    if start_volume:
-                        self._volume = DiceBag(start_volume).maximum()
-                    else:
-                        self._volume = int_or_default(self.object.part_LiquidVolume_Volume, 0)
-                    self._liquids = liquids.split(",")
-                    random_tiles = self.object.builder_RandomTile_Tiles
-                    self._tiles = [] if random_tiles is None else random_tiles.split(",")
-                    self._tiles.insert(0, self.painter.get_painted_liquid_path())
+                    # the colors come from the primary liquid, which is the same for every tile
+                    highest_pct: int = 0
+                    primary_liquid: str = "water"
+                    for liquid in liquids.split(","):
+                        liquid_name, pct = liquid.split("-")
+                        pct = int_or_default(pct, 0)
+                        if liquid_name in LIQUID_COLORS and pct > highest_pct:
+                            highest_pct = pct
+                            primary_liquid = liquid_name
+                    liquid_color = LIQUID_COLORS[primary_liquid]
+                    self._detail = extract_background_char(liquid_color, "transparent")
+                    self._tilecolor = extract_foreground_char(liquid_color, "y")
+                    self._tiles = (
+                        self.painter.get_painted_liquid_path(),
+                        *self.painter.random_tiles,
+                    )
 
     def _modification_count(self) -> int:
         return len(self._tiles)
 
     def _apply_modification(self, index: int) -> StyleMetadata:
-        highest_pct: int = 0
-        primary_liquid: str = "water"
-        for liquid in self._liquids:
-            liquid_name, pct = liquid.split("-")
-            pct = int_or_default(pct, 0)
-            if liquid_name in LIQUID_COLORS and pct > highest_pct:
-                highest_pct = pct
-                primary_liquid = liquid_name
         self.painter.trans = "transparent"
-        self.painter.detail = extract_background_char(LIQUID_COLORS[primary_liquid], "transparent")
-        self.painter.tilecolor = extract_foreground_char(LIQUID_COLORS[primary_liquid], "y")
-        self.painter.color = self.painter.tilecolor
+        self.painter.detail = self._detail
+        self.painter.tilecolor = self.painter.color = self._tilecolor
         self.painter.file = self._tiles[index]
         return StyleMetadata(
             meta_type="large pool" if index == 0 else f"puddle sprite #{index}",
@@ -606,7 +730,7 @@ class StyleLiquidVolume(TileStyle):
 class StyleHologram(TileStyle):
     """Style for the various Hologram parts."""
 
-    PARTS = ["part_HologramMaterial", "part_HologramWallMaterial", "part_HologramMaterialPrimary"]
+    __slots__ = ()
 
     def __init__(self, _painter):
         super().__init__(
@@ -617,7 +741,7 @@ class StyleHologram(TileStyle):
         )
 
     def _modification_count(self) -> int:
-        return 1 if any(self.object.is_specified(part) for part in StyleHologram.PARTS) else 0
+        return 1 if self.painter.paint_flags & PAINT_HOLOGRAM else 0
 
     def _apply_modification(self, index: int) -> StyleMetadata:
         self.painter.color, self.painter.tilecolor, self.painter.detail = "&B", "&B", "b"
@@ -627,50 +751,54 @@ class StyleHologram(TileStyle):
 class StyleExaminerUnknown(TileStyle):
     """Styles for the alternate "unknown" tiles of objects that have the Examiner part."""
 
+    __slots__ = ("_unknown_tile", "_unknown_detail", "_unknown_color")
+    TRIGGERS = ("part_Examiner",)
+
     def __init__(self, _painter):
         super().__init__(
             _painter, _priority=20, _modifies=RenderProps.ALL, _allows=RenderProps.NONE
         )
         self._unknown_tile = None
-        if self.object.part_Examiner is not None and self.object.part_Examiner_KeepTile != "true":
+        obj = self.object
+        examiner = obj.part_Examiner
+        unkobjname = None if examiner is None else examiner.get("Unknown")
+        if examiner is not None and examiner.get("KeepTile") != "true":
             """KeepTile indicates no special unidentified tile (ex: Furniture)"""
-            unkobjname = self.object.part_Examiner_Unknown
-            unkobj = self.object.qindex[unkobjname if unkobjname is not None else "BaseUnknown"]
-            unktile = getattr(unkobj, "part_Render_Tile", None)
-            unktilecolor = getattr(unkobj, "part_Render_TileColor", None)
-            unkcolor = (
-                unktilecolor
-                if unktilecolor is not None
-                else getattr(unkobj, "part_Render_ColorString", None)
-            )
-            unkdetail = getattr(unkobj, "part_Render_DetailColor", None)
+            unkobj = obj.qindex[unkobjname if unkobjname is not None else "BaseUnknown"]
+            unkrender = unkobj.part_Render or {}
+            unktile = unkrender.get("Tile")
+            unktilecolor = unkrender.get("TileColor")
+            unkcolor = unktilecolor if unktilecolor is not None else unkrender.get("ColorString")
+            unkdetail = unkrender.get("DetailColor")
             self._unknown_tile = unktile if unktile is not None else "items/sw_gadget.bmp"
             self._unknown_detail = unkdetail if unkdetail is not None else "C"
             self._unknown_color = unkcolor if unkcolor is not None else "&c"
 
     def _modification_count(self) -> int:
-        if self._unknown_tile is not None:
-            complexity = self.object.complexity
-            if complexity is not None and complexity > 0:
-                understanding = self.object.part_Examiner_Understanding
-                if understanding is None or int(understanding) < complexity:
-                    unkobjname = self.object.part_Examiner_Unknown
-                    unkobjname = unkobjname if unkobjname is not None else "BaseUnknown"
-                    if unkobjname != "UnknownMed":
-                        # tonics excluded due to random coloring - they have their own style
-                        return 2
+        if self._unknown_tile is None:
+            return 0
+        examiner = self.object.part_Examiner
+        # tonics (UnknownMed) excluded due to random coloring - they have their own style
+        if examiner.get("Unknown") == "UnknownMed":
+            return 0
+        complexity = self.object.complexity
+        if complexity is not None and complexity > 0:
+            understanding = examiner.get("Understanding")
+            if understanding is None or int(understanding) < complexity:
+                return 2
         return 0
 
     def _apply_modification(self, index: int) -> StyleMetadata:
+        painter = self.painter
         is_identified = index % 2 == 0
         self._unknown_detail = (
-            self._unknown_detail if self._unknown_detail != "" else self.painter.detail
+            self._unknown_detail if self._unknown_detail != "" else painter.detail
         )
-        c = self.painter.tilecolor if self.painter.tilecolor is not None else self.painter.color
+        c = painter.tilecolor if painter.tilecolor is not None else painter.color
         self._unknown_color = self._unknown_color if self._unknown_color != "" else c
-        self.painter.file = self.painter.file if is_identified else self._unknown_tile
-        self.painter.detail = self.painter.detail if is_identified else self._unknown_detail
-        self.painter.color = self.painter.tilecolor = c if is_identified else self._unknown_color
+        painter.file = painter.file if is_identified else self._unknown_tile
+        painter.detail = painter.detail if is_identified else self._unknown_detail
+        painter.color = painter.tilecolor = c if is_identified else self._unknown_color
         descriptor = "identified" if is_identified else "unidentified"
         return StyleMetadata(meta_type=descriptor, meta_type_after=True)
 
@@ -678,18 +806,21 @@ class StyleExaminerUnknown(TileStyle):
 class StyleRandomTonic(TileStyle):
     """Styles for Tonics, which have random colors for each new playthrough."""
 
-    NAMES_AND_COLORS = [
-        "milky,&Y",
-        "smokey,&K",
-        "turquoise,&C",
-        "cobalt,&b",
-        "violet,&m",
-        "rosey,&R",
-        "mossy,&g",
-        "muddy,&w",
-        "gold-flecked,&W",
-        "platinum,&y",
-    ]
+    __slots__ = ()
+    TRIGGERS = ("part_Examiner",)
+
+    NAMES_AND_COLORS = (
+        ("milky", "&Y"),
+        ("smokey", "&K"),
+        ("turquoise", "&C"),
+        ("cobalt", "&b"),
+        ("violet", "&m"),
+        ("rosey", "&R"),
+        ("mossy", "&g"),
+        ("muddy", "&w"),
+        ("gold-flecked", "&W"),
+        ("platinum", "&y"),
+    )
 
     def __init__(self, _painter):
         super().__init__(
@@ -703,7 +834,7 @@ class StyleRandomTonic(TileStyle):
         return 10 if self.object.part_Examiner_Unknown == "UnknownMed" else 0
 
     def _apply_modification(self, index: int) -> StyleMetadata:
-        tonic_name, tonic_color = StyleRandomTonic.NAMES_AND_COLORS[index].split(",")
+        tonic_name, tonic_color = StyleRandomTonic.NAMES_AND_COLORS[index]
         self.painter.color = self.painter.tilecolor = tonic_color
         descriptor = f"a small {tonic_name} tube"
         return StyleMetadata(meta_type=descriptor, f_postfix=tonic_name)
@@ -712,8 +843,24 @@ class StyleRandomTonic(TileStyle):
 class StyleSultanShrine(TileStyle):
     """Styles for the SultanShrine part."""
 
-    COLORS = ["g", "r", "c", "w", "Y"]
-    LABELS = ["under sky", "caves/red", "caves/cerulean", "caves/brown", "caves/white"]
+    __slots__ = ()
+    TRIGGERS = ("part_SultanShrine",)
+
+    COLORS = ("g", "r", "c", "w", "Y")
+    LABELS = ("under sky", "caves/red", "caves/cerulean", "caves/brown", "caves/white")
+    SHRINE_ENTRIES = tuple(
+        # (tile path, detail color, metadata type, filename postfix) for 8 common and 8 rare
+        # statue sprites in each of the shrine colors
+        (
+            f"Terrain/sw_sultanstatue_{'rare_' if is_rare else ''}{idx}.bmp",
+            color,
+            f"sprite #{idx + 8 * is_rare}, {label}",
+            f" variant {idx + 8 * is_rare}, {color}",
+        )
+        for (color, label), is_rare, idx in itertools.product(
+            zip(COLORS, LABELS), (False, True), range(1, 9)
+        )
+    )
 
     def __init__(self, _painter):
         super().__init__(
@@ -724,30 +871,28 @@ class StyleSultanShrine(TileStyle):
         return 80 if self.object.part_SultanShrine is not None else 0
 
     def _apply_modification(self, index: int) -> StyleMetadata:
-        idx = index % 8 + 1
-        descriptive_idx = index % 16 + 1
-        is_rare = ((index // 8) % 2) == 1
-        color_idx = index // 16
-        self.painter.detail = StyleSultanShrine.COLORS[color_idx]
-        self.painter.tilecolor = extract_foreground_char(self.painter.color, "y")
-        self.painter.color = self.painter.tilecolor
-        self.painter.trans = "transparent"
-        self.painter.file = "Terrain/sw_sultanstatue_" + ("rare_" if is_rare else "") + f"{idx}.bmp"
-        descriptor = f"sprite #{descriptive_idx}, {StyleSultanShrine.LABELS[color_idx]}"
-        postfix = f" variant {descriptive_idx}, {StyleSultanShrine.COLORS[color_idx]}"
+        painter = self.painter
+        file, detail, descriptor, postfix = StyleSultanShrine.SHRINE_ENTRIES[index]
+        painter.detail = detail
+        painter.tilecolor = extract_foreground_char(painter.color, "y")
+        painter.color = painter.tilecolor
+        painter.trans = "transparent"
+        painter.file = file
         return StyleMetadata(meta_type=descriptor, f_postfix=postfix)
 
 
 class StylePistonPress(TileStyle):
     """Styles for the PistonPressElement part."""
 
-    PATHS = [
-        "Items/sw_crusher_s_press.bmp",
-        "Items/sw_crusher_s_extend.bmp",
-        "Items/sw_crusher_s_closed.png",
-    ]
-    TYPES = ["ready", "extended (base)", "extended (top)"]
-    POSTFIXES = ["ready", "extended base", "extended top"]
+    __slots__ = ()
+    TRIGGERS = ("part_PistonPressElement",)
+
+    STATES = (
+        # (tile path, metadata type, filename postfix)
+        ("Items/sw_crusher_s_press.bmp", "ready", "ready"),
+        ("Items/sw_crusher_s_extend.bmp", "extended (base)", "extended base"),
+        ("Items/sw_crusher_s_closed.png", "extended (top)", "extended top"),
+    )
 
     def __init__(self, _painter):
         super().__init__(
@@ -758,24 +903,31 @@ class StylePistonPress(TileStyle):
         return 3 if self.object.part_PistonPressElement is not None else 0
 
     def _apply_modification(self, index: int) -> StyleMetadata:
-        self.painter.file = StylePistonPress.PATHS[index]
-        return StyleMetadata(
-            meta_type=StylePistonPress.TYPES[index], f_postfix=StylePistonPress.POSTFIXES[index]
-        )
+        self.painter.file, meta_type, postfix = StylePistonPress.STATES[index]
+        return StyleMetadata(meta_type=meta_type, f_postfix=postfix)
 
 
 class StyleMachineWallTubing(TileStyle):
     """Styles for machine wall objects."""
 
-    TYPES = {
-        "MachineWallHotTubing": ["hot", "hot (glowing in the dark)", "empty"],
-        "MachineWallColdTubing": ["cold", "cold (glowing in the dark)", "empty"],
-    }
-    POSTFIXES = {
-        "MachineWallHotTubing": [" hot", " hot glowing", " empty"],
-        "MachineWallColdTubing": [" cold", " cold glowing", " empty"],
+    __slots__ = ()
+
+    STATES = {
+        # object name: ((metadata type, filename postfix), ...)
+        "MachineWallHotTubing": (
+            ("hot", " hot"),
+            ("hot (glowing in the dark)", " hot glowing"),
+            ("empty", " empty"),
+        ),
+        "MachineWallColdTubing": (
+            ("cold", " cold"),
+            ("cold (glowing in the dark)", " cold glowing"),
+            ("empty", " empty"),
+        ),
     }
 
+    TRIGGER_NAMES = tuple(STATES)
+
     def __init__(self, _painter):
         super().__init__(
             _painter,
@@ -785,7 +937,7 @@ class StyleMachineWallTubing(TileStyle):
         )
 
     def _modification_count(self) -> int:
-        return 3 if self.object.name in self.TYPES else 0
+        return 3 if self.object.name in self.STATES else 0
 
     def _apply_modification(self, index: int) -> StyleMetadata:
         if index == 1:
@@ -795,49 +947,49 @@ class StyleMachineWallTubing(TileStyle):
                 self.painter.color = self.painter.tilecolor = f"&{fg}^{bg}"
         if index == 2:
             self.painter.color = self.painter.tilecolor = "&y^c"  # MachineWallEmptyTubing
-        return StyleMetadata(
-            meta_type=self.TYPES[self.object.name][index],
-            f_postfix=self.POSTFIXES[self.object.name][index],
-        )
+        meta_type, postfix = self.STATES[self.object.name][index]
+        return StyleMetadata(meta_type=meta_type, f_postfix=postfix)
 
 
 class StyleHarvestable(TileStyle):
     """Styles for the Harvestable part."""
 
+    __slots__ = ()
+    TRIGGERS = ("part_Harvestable",)
+
+    RIPE_LABELS = {
+        # override 'ripe' language when it doesn't make sense
+        "PhaseWeb": ("harvestable", "not harvestable"),
+    }
+
     def __init__(self, _painter):
         super().__init__(
             _painter, _priority=20, _modifies=RenderProps.COLORS, _allows=RenderProps.ALL
         )
-        self._count: Optional[int] = None
 
     def _modification_count(self) -> int:
-        if self._count is None:
-            self._count = 0
-            ripe_tilecolor = self.object.part_Harvestable_RipeTileColor
-            unripe_tilecolor = self.object.part_Harvestable_UnripeTileColor
-            if (
-                ripe_tilecolor is not None
-                and unripe_tilecolor is not None
-                and ripe_tilecolor != unripe_tilecolor
-            ):
-                self._count = 2
-            else:
-                unripe_detail = self.object.part_Harvestable_UnripeDetailColor
-                ripe_detail = self.object.part_Harvestable_RipeDetailColor
-                if (
-                    ripe_detail is not None
-                    and unripe_detail is not None
-                    and ripe_detail != unripe_detail
-                ):
-                    self._count = 2
-        return self._count
+        harvestable = self.object.part_Harvestable
+        if harvestable is None:
+            return 0
+        ripe_tilecolor = harvestable.get("RipeTileColor")
+        unripe_tilecolor = harvestable.get("UnripeTileColor")
+        if (
+            ripe_tilecolor is not None
+            and unripe_tilecolor is not None
+            and ripe_tilecolor != unripe_tilecolor
+        ):
+            return 2
+        unripe_detail = harvestable.get("UnripeDetailColor")
+        ripe_detail = harvestable.get("RipeDetailColor")
+        if ripe_detail is not None and unripe_detail is not None and ripe_detail != unripe_detail:
+            return 2
+        return 0
 
     def _apply_modification(self, index: int) -> StyleMetadata:
         is_ripe = index == 0
         self.painter.paint_harvestable(is_ripe=is_ripe)
-        ripe_string = "ripe" if is_ripe else "not ripe"
-        if self.object.name == "PhaseWeb":  # override 'ripe' language when it doesn't make sense
-            ripe_string = "harvestable" if is_ripe else "not harvestable"
+        ripe_labels = StyleHarvestable.RIPE_LABELS.get(self.object.name, ("ripe", "not ripe"))
+        ripe_string = ripe_labels[0 if is_ripe else 1]
         return StyleMetadata(meta_type=ripe_string, f_postfix="ripe" if is_ripe else "unripe")
 
 
@@ -847,54 +999,62 @@ class StyleArspliceHyphae(TileStyle):
     sprites, and also includes variable tiles (all other Harvestables permute colors only). This
     also supercedes the RandomTile builder on Arsplice Hyphae to avoid additional complexity."""
 
+    __slots__ = ("_variants",)
+
     def __init__(self, _painter):
         super().__init__(
             _painter, _priority=100, _modifies=RenderProps.ALL, _allows=RenderProps.NONE
         )
-        self._count: int = 0
+        # (color, detail, file, meta type, filename postfix) for each index; None leaves a
+        # property unchanged
+        self._variants: Tuple[Tuple[Optional[str], ...], ...] = ()
         if self.object.inherits_from("Arsplice Hyphae"):
-            self._ripe_tiles: List[str] = []
-            self._unripe_tiles: List[str] = []
-            for objkey in ["Arsplice Hyphae A", "Arsplice Hyphae B"]:
+            ripe_tiles: List[str] = []
+            unripe_tiles: List[str] = []
+            ripe_color = unripe_color = ripe_detail = unripe_detail = None
+            for objkey in ("Arsplice Hyphae A", "Arsplice Hyphae B"):
                 if objkey in self.object.qindex:
                     obj = self.object.qindex[objkey]
-                    self._ripe_color = obj.part_Harvestable_RipeColor
-                    self._unripe_color = obj.part_Harvestable_UnripeColor
-                    self._ripe_detail = obj.part_Harvestable_RipeDetailColor
-                    self._unripe_detail = obj.part_Harvestable_UnripeDetailColor
-                    self._ripe_tiles.extend(obj.part_Harvestable_RipeTiles.split(","))
-                    self._unripe_tiles.extend(obj.part_Harvestable_UnripeTiles.split(","))
-            self._count = len(self._ripe_tiles) + len(self._unripe_tiles)
+                    ripe_color = obj.part_Harvestable_RipeColor
+                    unripe_color = obj.part_Harvestable_UnripeColor
+                    ripe_detail = obj.part_Harvestable_RipeDetailColor
+                    unripe_detail = obj.part_Harvestable_UnripeDetailColor
+                    ripe_tiles.extend(obj.part_Harvestable_RipeTiles.split(","))
+                    unripe_tiles.extend(obj.part_Harvestable_UnripeTiles.split(","))
+            states = (
+                (ripe_color, ripe_detail, ripe_tiles, "ripe", "ripe"),
+                (unripe_color, unripe_detail, unripe_tiles, "not ripe", "unripe"),
+            )
+            variants = []
+            for index in range(len(ripe_tiles) + len(unripe_tiles)):
+                color, detail, tiles, label, file_label = states[index % 2]  # even indices are ripe
+                file_idx = index // 2
+                file = tiles[file_idx] if len(tiles) > file_idx else None
+                meta_type = f"{label} (variation #{file_idx + 1})"
+                postfix = f"{file_label} variation {file_idx + 1}"
+                variants.append((color, detail, file, meta_type, postfix))
+            self._variants = tuple(variants)
 
     def _modification_count(self) -> int:
-        return self._count
+        return len(self._variants)
 
     def _apply_modification(self, index: int) -> StyleMetadata:
-        is_ripe = index % 2 == 0
-        file_idx = index // 2
+        color, detail, file, meta_type, postfix = self._variants[index]
         painter = self.painter
-        if is_ripe:
-            painter.color = painter.color if self._ripe_color is None else self._ripe_color
-            painter.detail = painter.detail if self._ripe_detail is None else self._ripe_detail
-            if len(self._ripe_tiles) > file_idx:
-                painter.file = self._ripe_tiles[file_idx]
-        else:
-            painter.color = painter.color if self._unripe_color is None else self._unripe_color
-            painter.detail = painter.detail if self._unripe_detail is None else self._unripe_detail
-            if len(self._unripe_tiles) > file_idx:
-                painter.file = self._unripe_tiles[file_idx]
-        ripe_string = "ripe" if is_ripe else "not ripe"
-        ripe_filestring = "ripe" if is_ripe else "unripe"
-        return StyleMetadata(
-            meta_type=f"{ripe_string} (variation #{file_idx + 1})",
-            f_postfix=f"{ripe_filestring} variation {file_idx + 1}",
-        )
+        if color is not None:
+            painter.color = color
+        if detail is not None:
+            painter.detail = detail
+        if file is not None:
+            painter.file = file
+        return StyleMetadata(meta_type=meta_type, f_postfix=postfix)
 
 
 class StyleAloes(TileStyle):
     """Styles for Aloe objects."""
 
-    PARTS = ["DischargeOnStep", "CrossFlameOnStep", "FugueOnStep"]
+    __slots__ = ()
+    TRIGGERS = ("part_DischargeOnStep", "part_CrossFlameOnStep", "part_FugueOnStep")
 
     def __init__(self, _painter):
         super().__init__(
@@ -905,7 +1065,7 @@ class StyleAloes(TileStyle):
         )
 
     def _modification_count(self) -> int:
-        return 2 if obj_has_any_part(self.object, StyleAloes.PARTS) else 0
+        return 2 if self.painter.paint_flags & PAINT_ALOE else 0
 
     def _apply_modification(self, index: int) -> StyleMetadata:
         is_ready = index == 0
@@ -917,22 +1077,23 @@ class StyleAloes(TileStyle):
 class StyleDoor(TileStyle):
     """Styles for the Door part."""
 
+    __slots__ = ()
+    TRIGGERS = ("part_Door",)
+
     def __init__(self, _painter):
         super().__init__(
             _painter, _priority=50, _modifies=RenderProps.FILE, _allows=RenderProps.ALL
         )
 
     def _modification_count(self) -> int:
-        if self.object.part_Door is None:
+        door = self.object.part_Door
+        if door is None:
             return 0
-        if self.object.inherits_from("Double Door"):
-            dirs = ["_w_", "_w.", "_e_", "_e."]
-            if (
-                self.object.part_Door_ClosedTile is not None
-                and any(d in self.object.part_Door_ClosedTile for d in dirs)
-            ) or (
-                self.object.part_Door_OpenTile is not None
-                and any(d in self.object.part_Door_OpenTile for d in dirs)
+        if self.painter.paint_flags & PAINT_DOUBLE_DOOR:
+            closed_tile = door.get("ClosedTile")
+            open_tile = door.get("OpenTile")
+            if (closed_tile is not None and DIRECTION_MARKER_PATTERN.search(closed_tile)) or (
+                open_tile is not None and DIRECTION_MARKER_PATTERN.search(open_tile)
             ):
                 return 4
         return 2
@@ -940,26 +1101,28 @@ class StyleDoor(TileStyle):
     def _apply_modification(self, index: int) -> StyleMetadata:
         is_closed, double_door_alt = index % 2 == 0, index >= 2
         self.painter.paint_door(is_closed=is_closed, double_door_alt=double_door_alt)
-        descriptor = "closed" if is_closed else "open"
-        if self.object.inherits_from("Double Door"):
-            if "_w_" in self.painter.file or "_w." in self.painter.file:
-                descriptor += " (west)"
-            elif "_e_" in self.painter.file or "_e." in self.painter.file:
-                descriptor += " (east)"
-        return StyleMetadata(meta_type=descriptor)
+        direction = None
+        if self.painter.paint_flags & PAINT_DOUBLE_DOOR:
+            direction = _marked_direction(self.painter.file, DIRECTION_MARKERS)
+        return StyleMetadata(meta_type=CLOSURE_DESCRIPTORS[is_closed, direction])
 
 
 class StyleEnclosing(TileStyle):
     """Styles for the Enclosing part."""
 
-    ATTRIBUTES = [
+    __slots__ = ()
+    TRIGGERS = ("part_Enclosing",)
+
+    ATTRIBUTES = (
         "part_Enclosing_OpenTile",
         "part_Enclosing_ClosedTile",
         "part_Enclosing_OpenColor",
         "part_Enclosing_ClosedColor",
         "part_Enclosing_OpenTileColor",
         "part_Enclosing_ClosedTileColor",
-    ]
+    )
+    """Enclosing part attributes, at least one of which must be specified to apply this style."""
+    _ATTRIBUTE_KEYS = frozenset(att.removeprefix("part_Enclosing_") for att in ATTRIBUTES)
 
     def __init__(self, _painter):
         super().__init__(
@@ -970,26 +1133,27 @@ class StyleEnclosing(TileStyle):
         )
 
     def _modification_count(self) -> int:
-        if self.object.part_Enclosing is not None:
-            if any(getattr(self.object, att) is not None for att in StyleEnclosing.ATTRIBUTES):
-                return 4 if self.object.part_DoubleEnclosing is not None else 2
+        enclosing = self.object.part_Enclosing
+        if enclosing is not None:
+            if not StyleEnclosing._ATTRIBUTE_KEYS.isdisjoint(enclosing):
+                return 4 if self.painter.paint_flags & PAINT_DOUBLE_ENCLOSING else 2
         return 0
 
     def _apply_modification(self, index: int) -> StyleMetadata:
         is_closed, double_enclosing_alt = index % 2 == 0, index >= 2
         self.painter.paint_enclosing(is_closed=is_closed, double_enclosing_alt=double_enclosing_alt)
-        descriptor = "closed" if is_closed else "open"
-        if self.object.part_DoubleEnclosing is not None:
-            if "_w." in self.painter.file:
-                descriptor += " (west)"
-            elif "_e." in self.painter.file:
-                descriptor += " (east)"
-        return StyleMetadata(meta_type=descriptor)
+        direction = None
+        if self.painter.paint_flags & PAINT_DOUBLE_ENCLOSING:
+            direction = _marked_direction(self.painter.file, SUFFIX_DIRECTION_MARKERS)
+        return StyleMetadata(meta_type=CLOSURE_DESCRIPTORS[is_closed, direction])
 
 
 class StyleDoubleContainer(TileStyle):
     """Styles for the DoubleContainer part."""
 
+    __slots__ = ()
+    TRIGGERS = ("part_DoubleContainer",)
+
     def __init__(self, _painter):
         super().__init__(
             _painter, _priority=40, _modifies=RenderProps.FILE, _allows=RenderProps.NONFILE
@@ -1003,21 +1167,21 @@ class StyleDoubleContainer(TileStyle):
             self.painter.file = self.painter.file.replace("_w.", "_e.")
         if "_e." in self.painter.file and index == 0:
             self.painter.file = self.painter.file.replace("_e.", "_w.")
-        if "_w." in self.painter.file:
-            descriptor = "(west)"
-        elif "_e." in self.painter.file:
-            descriptor = "(east)"
-        else:
+        direction = _marked_direction(self.painter.file, SUFFIX_DIRECTION_MARKERS)
+        if direction is None:
             raise ValueError(
                 "Unsupported format for DoubleContainer tile filepath in object"
                 + f" {self.object.name}."
             )
-        return StyleMetadata(meta_type=descriptor)
+        return StyleMetadata(meta_type=DIRECTION_DESCRIPTORS[direction])
 
 
 class StyleHangable(TileStyle):
     """Styles for the Hangable part."""
 
+    __slots__ = ()
+    TRIGGERS = ("part_Hangable",)
+
     def __init__(self, _painter):
         super().__init__(
             _painter, _priority=40, _modifies=RenderProps.FILE, _allows=RenderProps.NONFILE
@@ -1038,49 +1202,88 @@ class StyleHangable(TileStyle):
 class StyleSofa(TileStyle):
     """Styles for the Sofa object."""
 
+    __slots__ = ("_file_prefix", "_file_ext")
+    TRIGGER_NAMES = ("Sofa",)
+
+    SEGMENTS = (("l", "left"), ("c", "center"), ("r", "right"))
+
     def __init__(self, _painter):
         super().__init__(
             _painter, _priority=40, _modifies=RenderProps.FILE, _allows=RenderProps.NONFILE
         )
+        self._file_prefix = self._file_ext = None
+        render_tile = None
+        if self.object.name == "Sofa" or self.object.inheritingfrom == "Sofa":
+            render_tile = self.object.part_Render_Tile
+        if render_tile is not None:
+            # the render tile ends in the segment letter, which is swapped out for each segment
+            filename, self._file_ext = os.path.splitext(render_tile)
+            self._file_prefix = filename[:-1]
 
     def _modification_count(self) -> int:
-        return 3 if self.object.name == "Sofa" or self.object.inheritingfrom == "Sofa" else 0
+        return 3 if self._file_prefix is not None else 0
 
     def _apply_modification(self, index: int) -> StyleMetadata:
-        suffix, descriptor = [("l", "left"), ("c", "center"), ("r", "right")][index]
-        filename, fileext = os.path.splitext(self.object.part_Render_Tile)
-        self.painter.file = filename[:-1] + suffix + fileext
+        suffix, descriptor = StyleSofa.SEGMENTS[index]
+        self.painter.file = self._file_prefix + suffix + self._file_ext
         return StyleMetadata(meta_type=descriptor)
 
 
 class StyleOrnatePottedPlant(TileStyle):
     """Styles for the Ornate Potted Plant 1-4 objects."""
 
+    __slots__ = ("_variants",)
+
     def __init__(self, _painter):
         super().__init__(
             _painter, _priority=40, _modifies=RenderProps.ALL, _allows=RenderProps.NONE
         )
+        self._variants = None
+        if self.object.name.startswith("Ornate Potted Plant "):
+            # (colorstring, tilecolor, detailcolor, tile) for each sprite, or None if missing
+            variants = []
+            for i in range(1, 5):
+                sibling = self.object.qindex.get(f"Ornate Potted Plant {i}")
+                if sibling is not None:
+                    variants.append(
+                        (
+                            sibling.part_Render_ColorString,
+                            sibling.part_Render_TileColor,
+                            sibling.part_Render_DetailColor,
+                            sibling.part_Render_Tile,
+                        )
+                    )
+                else:
+                    variants.append(None)
+            self._variants = tuple(variants)
 
     def _modification_count(self) -> int:
-        return 4 if self.object.name.startswith("Ornate Potted Plant ") else 0
+        return 4 if self._variants is not None else 0
 
     def _apply_modification(self, index: int) -> StyleMetadata:
-        objkey = f"Ornate Potted Plant {index + 1}"
-        if objkey in self.object.qindex:
-            self.painter.color = self.object.qindex[objkey].part_Render_ColorString
-            self.painter.tilecolor = self.object.qindex[objkey].part_Render_TileColor
-            self.painter.detail = self.object.qindex[objkey].part_Render_DetailColor
-            self.painter.file = self.object.qindex[objkey].part_Render_Tile
+        variant = self._variants[index]
+        if variant is not None:
+            painter = self.painter
+            painter.color, painter.tilecolor, painter.detail, painter.file = variant
         descriptor = f"sprite #{index + 1}"
         postfix = f" variation {index}" if index > 0 else ""
         return StyleMetadata(meta_type=descriptor, f_postfix=postfix)
 
 
+# color variants of each fixture family, keyed by the GameRoot whose object index they were collected
+# from; entries are dropped along with their GameRoot
+_FIXTURE_VARIANTS: WeakKeyDictionary[Any, Dict[str, List[Tuple]]] = WeakKeyDictionary()
+
+
 class StyleFixtureWithChildAlternates(TileStyle):
     """Styles for walls and other fixtures that define their own colors, and also have
     child (inherting) objects with the same display name that define variations of those colors."""
 
-    PARENT_WALL_OBJECTS = ["FulcreteWithSquareWave", "ColumbariumWall", "GlassHydraulicPipe"]
+    __slots__ = ("_matches",)
+
+    PARENT_WALL_OBJECTS = ("FulcreteWithSquareWave", "ColumbariumWall", "GlassHydraulicPipe")
+    _PARENT_WALL_NAMES = frozenset(PARENT_WALL_OBJECTS)
+    TRIGGER_NAMES = PARENT_WALL_OBJECTS
 
     def __init__(self, _painter):
         super().__init__(
@@ -1090,23 +1293,51 @@ class StyleFixtureWithChildAlternates(TileStyle):
             _allows=RenderProps.FILE,
         )
         self._matches = None
-        for wallname in self.PARENT_WALL_OBJECTS:
-            if self.object.name == wallname or self.object.inheritingfrom == wallname:
-                self._matches = [
-                    obj
-                    for obj in self.object.qindex.values()
-                    if (obj.inheritingfrom == wallname or obj.name == wallname)
-                ]
-                if len(self._matches) > 0:
-                    uniquecolorcombos = {}
-                    self._matches.sort(key=lambda obj: obj.name)  # sort by object name
-                    for obj in self._matches:
-                        colorstring = obj.part_Render_ColorString
-                        tilecolor = obj.part_Render_TileColor
-                        detailcolor = obj.part_Render_DetailColor
-                        uniquecolorcombos[(colorstring, tilecolor, detailcolor)] = True
-                    self._matches = list(uniquecolorcombos.keys())
-                break
+        name, parent = self.object.name, self.object.inheritingfrom
+        if name in self._PARENT_WALL_NAMES or parent in self._PARENT_WALL_NAMES:
+            # if both are parent fixtures, the one listed first in PARENT_WALL_OBJECTS wins
+            for wallname in self.PARENT_WALL_OBJECTS:
+                if name == wallname or parent == wallname:
+                    self._matches = self._color_variants(self.object)[wallname]
+                    break
+
+    @classmethod
+    def _color_variants(cls, qud_object) -> Dict[str, List[Tuple]]:
+        """Returns the color variants of every fixture family in the object index that qud_object
+        belongs to. These are collected once per GameRoot and shared by all of its painters; objects
+        that were created without a GameRoot scan their object index each time."""
+        gameroot = qud_object.gameroot
+        if gameroot is None:
+            return cls._collect_color_variants(qud_object.qindex)
+        variants = _FIXTURE_VARIANTS.get(gameroot)
+        if variants is None:
+            variants = cls._collect_color_variants(qud_object.qindex)
+            _FIXTURE_VARIANTS[gameroot] = variants
+        return variants
+
+    @classmethod
+    def _collect_color_variants(cls, qindex: dict) -> Dict[str, List[Tuple]]:
+        """Returns the unique (colorstring, tilecolor, detailcolor) combinations of each parent
+        fixture and its direct children, ordered by object name. The variants of every family are
+        collected together in a single scan of the object index."""
+        families = {wallname: [] for wallname in cls.PARENT_WALL_OBJECTS}
+        for obj in qindex.values():
+            for key in (obj.name, obj.inheritingfrom):
+                if key in families:
+                    families[key].append(obj)
+        variants = {}
+        for wallname, matches in families.items():
+            matches.sort(key=lambda obj: obj.name)  # sort by object name
+            uniquecolorcombos = dict.fromkeys(
+                (
+                    obj.part_Render_ColorString,
+                    obj.part_Render_TileColor,
+                    obj.part_Render_DetailColor,
+                )
+                for obj in matches
+            )
+            variants[wallname] = list(uniquecolorcombos)
+        return variants
 
     def _modification_count(self) -> int:
         return 0 if self._matches is None else len(self._matches)
@@ -1128,13 +1359,16 @@ class StyleFixtureWithChildAlternates(TileStyle):
 class StyleAsterisk(TileStyle):
     """Styles for the PointedAsteriskBuilder part."""
 
-    TILES = [
-        "Items/sw_asterisk_3.bmp",
-        "Items/sw_asterisk_4.bmp",
-        "Items/sw_asterisk_5.bmp",
-        "Items/sw_asterisk_6plus.bmp",
-    ]
-    LABELS = ["three-pointed", "four-pointed", "five-pointed", "many-pointed"]
+    __slots__ = ()
+    TRIGGERS = ("part_PointedAsteriskBuilder",)
+
+    STATES = (
+        # (tile path, metadata type, filename postfix)
+        ("Items/sw_asterisk_3.bmp", "three-pointed", "(three-pointed)"),
+        ("Items/sw_asterisk_4.bmp", "four-pointed", "(four-pointed)"),
+        ("Items/sw_asterisk_5.bmp", "five-pointed", "(five-pointed)"),
+        ("Items/sw_asterisk_6plus.bmp", "many-pointed", "(many-pointed)"),
+    )
 
     def __init__(self, _painter):
         super().__init__(
@@ -1145,15 +1379,44 @@ class StyleAsterisk(TileStyle):
         return 4 if self.object.part_PointedAsteriskBuilder is not None else 0
 
     def _apply_modification(self, index: int) -> StyleMetadata:
-        self.painter.file = StyleAsterisk.TILES[index]
-        return StyleMetadata(
-            meta_type=StyleAsterisk.LABELS[index], f_postfix=f"({StyleAsterisk.LABELS[index]})"
-        )
+        self.painter.file, meta_type, postfix = StyleAsterisk.STATES[index]
+        return StyleMetadata(meta_type=meta_type, f_postfix=postfix)
+
+
+_PositionedStyles = List[Tuple[int, Type[TileStyle]]]
+
+
+def _index_style_triggers(
+    styles: List[Type[TileStyle]],
+) -> Tuple[_PositionedStyles, Dict[str, _PositionedStyles], Dict[str, _PositionedStyles]]:
+    """Groups the specified TileStyle classes by their TRIGGERS and TRIGGER_NAMES. Returns the
+    styles that have neither, a dict mapping each trigger attribute to the styles it enables, and
+    a dict mapping each trigger name to the styles it enables. Each style is paired with its
+    position in the specified list so that the original order can be restored."""
+    untriggered = []
+    by_trigger = {}
+    by_name = {}
+    for position, style_class in enumerate(styles):
+        if not style_class.TRIGGERS and not style_class.TRIGGER_NAMES:
+            untriggered.append((position, style_class))
+        for trigger in style_class.TRIGGERS:
+            by_trigger.setdefault(trigger, []).append((position, style_class))
+        for name in style_class.TRIGGER_NAMES:
+            by_name.setdefault(name, []).append((position, style_class))
+    return untriggered, by_trigger, by_name
 
 
 class StyleManager:
     # TODO: support grabbing a random style (for cryptogull)
 
+    __slots__ = (
+        "_painter",
+        "_applicable_styles",
+        "_style_counts",
+        "_combination_count",
+        "_style_limit",
+    )
+
     STYLE_LIMIT: int = 80
     """max limit for generated images for a single object ('flowers' has like 484 variants...)"""
 
@@ -1187,6 +1450,10 @@ class StyleManager:
     ]
     """A list of all TileStyle classes as type objects. The order of this list does not matter."""
 
+    _UNTRIGGERED_STYLES, _STYLES_BY_TRIGGER, _STYLES_BY_NAME = _index_style_triggers(Styles)
+    """Styles that must always be checked for applicability, and the remaining styles grouped by
+    the QudObject attributes and object names that trigger them."""
+
     def __init__(self, painter):
         """Accepts a TilePainter object and determines which styles are applicable to it.
 
@@ -1195,14 +1462,25 @@ class StyleManager:
         styles are applied to a TilePainter, and generally simplifying the tile styling process."""
         self._painter = painter
         self._applicable_styles: List[TileStyle] = []
-        self._index_combinations: List[Tuple[int, ...]] = []
-        for style_class in StyleManager.Styles:
+        self._style_counts: List[int] = []
+        self._combination_count: int = 0
+        obj = painter.obj
+        candidates = set(StyleManager._UNTRIGGERED_STYLES)
+        for trigger, triggered_styles in StyleManager._STYLES_BY_TRIGGER.items():
+            if getattr(obj, trigger) is not None:
+                candidates.update(triggered_styles)
+        for name in (obj.name, obj.inheritingfrom):
+            candidates.update(StyleManager._STYLES_BY_NAME.get(name, ()))
+        # styles whose triggers are all missing can't apply, so they aren't constructed. The rest
+        # are constructed in Styles order, which breaks ties between styles of equal priority
+        for _, style_class in sorted(candidates):
             style = style_class(painter)
             if style.is_applicable:
                 self._applicable_styles.append(style)
-        if len(self._applicable_styles) > 0:
+        if len(self._applicable_styles) > 1:  # a lone style needs no ordering or scope checks
             self._sort_styles()
             self._flatten_styles()
+        if len(self._applicable_styles) > 0:
             self._make_combinations()
 
         self._style_limit: Optional[int] = None
@@ -1214,50 +1492,54 @@ class StyleManager:
 
     def _sort_styles(self):
         """Sorts the applicable styles by priority (high to low)."""
-        self._applicable_styles.sort(
-            key=lambda style_instance: style_instance.priority, reverse=True
-        )
+        self._applicable_styles.sort(key=attrgetter("priority"), reverse=True)
 
     def _flatten_styles(self):
         """Pre-processes the style stack and removes styles that are not applicable (generally
         because other styles with higher priority don't allow their type of modifications)."""
-        i = 0
-        remaining = RenderProps.ALL
-        while i < len(self._applicable_styles):
-            style: TileStyle = self._applicable_styles[i]
-            if style.modifies_within_scope(allowed_scope=remaining):
-                # reduce allowed property scope of remaining styles
-                remaining = remaining & style.allows
-                i += 1
-            else:
+        remaining = int(RenderProps.ALL)
+        flattened = []
+        for style in self._applicable_styles:
+            if style._modifies & ~remaining != 0:
                 # log.warning(
                 #     'StyleManager discarded %s while flattening styles for object "%s"',
-                #     type(self._applicable_styles[i]),
+                #     type(style),
                 #     self._painter.obj,
                 # )
-                # remove style because it's not within remaining allowed style scope
-                del self._applicable_styles[i]
+                # drop style because it's not within remaining allowed style scope
+                continue
+            flattened.append(style)
+            # reduce allowed property scope of remaining styles
+            remaining &= style._allows
+        self._applicable_styles = flattened
 
     def _make_combinations(self):
-        """Generates all the possible indexing combinations for this set of styles.
+        """Records the modification count of each style, which determines the possible indexing
+        combinations for this set of styles.
 
         For example, if there is a 4-count style, a 2-count style, and a 3-count style which are
-        applicable to this TilePainter, generates a 24-member list of Tuples like the following:
-        [(1,1,1), (1,1,2), (1,1,3), (1,2,1), (1,2,2), (1,2,3), (2,1,1), ..., (4,2,2), (4,2,3)]"""
-        index_arrays: List[List[int]] = []
-        for style in self._applicable_styles:
-            index_arrays.append(list(range(style.modification_count())))
-        self._index_combinations = list(itertools.product(*index_arrays))
+        applicable to this TilePainter, there are 24 combinations, ordered like the following:
+        [(1,1,1), (1,1,2), (1,1,3), (1,2,1), (1,2,2), (1,2,3), (2,1,1), ..., (4,2,2), (4,2,3)]
+        The combinations aren't stored; _style_indices() computes the one for a global index."""
+        self._style_counts = [style.modification_count() for style in self._applicable_styles]
+        self._combination_count = 1
+        for count in self._style_counts:
+            self._combination_count *= count
+
+    def _style_indices(self, global_index: int) -> List[int]:
+        """Returns the index to use for each applicable style for the specified global style index,
+        treating the style counts as the digits of a mixed radix number (last style varies
+        fastest)."""
+        style_indices = [0] * len(self._style_counts)
+        for i in range(len(self._style_counts) - 1, -1, -1):
+            global_index, style_indices[i] = divmod(global_index, self._style_counts[i])
+        return style_indices
 
     def style_count(self) -> int:
         """Returns the global count of style combinations for this TilePainter. For example,
         Grave Moss has 5 RandomTile variants and a ripe/unripe Harvestable color variation. It will
         return 10 (5 * 2)."""
-        if len(self._applicable_styles) <= 0:
-            return 0
-        count = 1
-        for style in self._applicable_styles:
-            count *= style.modification_count()
+        count = self._combination_count
         return count if count <= self._style_limit else self._style_limit
 
     def apply_style(self, global_index: int) -> StyleMetadata:
@@ -1267,16 +1549,44 @@ class StyleManager:
         StyleManager was constructed).
 
         The general idea is to call style_count() to check the total number of merged global styles,
-        and then call apply_style() in a loop or for a specific index less than that style count."""
+        and then call apply_style() in a loop or for a specific index less than that style count.
+        Raises IndexError if the global style index is not lower than the number of combinations."""
+        if len(self._applicable_styles) == 0:
+            return StyleMetadata()
+        if global_index >= self._combination_count:
+            raise IndexError(
+                f"Style index {global_index} out of range for {self._painter.obj.name}."
+            )
+        if len(self._applicable_styles) == 1:  # most common case; nothing to decode or merge
+            return self._applicable_styles[0].apply_modification(global_index)
+        return self._apply_style_indices(self._style_indices(global_index))
+
+    def apply_all_styles(self) -> Iterator[StyleMetadata]:
+        """Applies each style permutation in turn, yielding the merged StyleMetadata for global
+        style indices 0 through style_count() - 1. This is equivalent to calling apply_style() for
+        each of those indices, but steps the index of each style like an odometer instead of
+        decoding every global index.
+
+        Every applicable style is still applied at each step, because styles don't necessarily
+        overwrite all of the properties set by their other indices."""
+        style_indices = [0] * len(self._style_counts)
+        for _ in range(self.style_count()):
+            yield self._apply_style_indices(style_indices)
+            i = len(style_indices) - 1
+            while i >= 0:  # last style varies fastest
+                style_indices[i] += 1
+                if style_indices[i] < self._style_counts[i]:
+                    break
+                style_indices[i] = 0
+                i -= 1
+
+    def _apply_style_indices(self, style_indices: List[int]) -> StyleMetadata:
+        """Applies each applicable style at its specified index and merges their metadata."""
         style_metadata: Optional[StyleMetadata] = None
-        if len(self._applicable_styles) > 0:
-            style_indices = self._index_combinations[global_index]
-            for style_index, style in zip(style_indices, self._applicable_styles):
-                metadata = style.apply_modification(style_index)
-                if style_metadata is None:
-                    style_metadata = metadata
-                else:
-                    style_metadata.merge_with(metadata)
-        if style_metadata is None:
-            style_metadata = StyleMetadata()
+        for style_index, style in zip(style_indices, self._applicable_styles):
+            metadata = style.apply_modification(style_index)
+            if style_metadata is None:
+                style_metadata = metadata
+            else:
+                style_metadata.merge_with(metadata)
         return style_metadata
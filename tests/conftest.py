@@ -1,6 +1,7 @@
 """Fixtures for pytest."""
 import logging
 from pathlib import Path
+from typing import Tuple
 
 import pytest
 
@@ -17,29 +18,33 @@ except FileNotFoundError:
     log.error('Tests require a game installation path to be in the file "game_location_for_tests".')
     raise
 
-_root = GameRoot(game_loc)
-_qud_object_root, _qindex = _root.get_object_tree()
-
 
 @pytest.fixture(scope="session")
 def gameroot() -> GameRoot:
     """Return the gameroot object"""
-    return _root
+    return GameRoot(game_loc)
 
 
 @pytest.fixture(scope="session")
-def character_codes() -> dict:
+def character_codes(gameroot) -> dict:
     """Return the character codes"""
-    return _root.get_character_codes()
+    return gameroot.get_character_codes()
+
+
+@pytest.fixture(scope="session")
+def object_tree(gameroot) -> Tuple[QudObject, dict]:
+    """Return the root QudObject and the dictionary mapping object IDs to QudObjects. The game XML
+    is only loaded for test sessions that request it."""
+    return gameroot.get_object_tree()
 
 
 @pytest.fixture(scope="session")
-def qud_object_root() -> QudObject:
+def qud_object_root(object_tree) -> QudObject:
     """Return the root QudObject"""
-    return _qud_object_root
+    return object_tree[0]
 
 
 @pytest.fixture(scope="session")
-def qindex() -> dict:
+def qindex(object_tree) -> dict:
     """Return the dictionary mapping object IDs to QudObjects"""
-    return _qindex
+    return object_tree[1]
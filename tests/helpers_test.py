@@ -1,6 +1,9 @@
 """Pytest file for functions in helpers.py"""
 
 from hagadias.helpers import (
+    extract_background_char,
+    extract_fore_back_chars,
+    extract_foreground_char,
     parse_qud_colors,
     iter_qud_colors,
     strip_oldstyle_qud_colors,
@@ -76,3 +79,15 @@ def test_strip_newstyle_qud_colors():
         strip_newstyle_qud_colors("{{O|persistent {{G-W-o sequence|papaya}}}}")
         == "persistent papaya"
     )
+
+
+def test_extract_fore_back_chars():
+    assert extract_fore_back_chars("&r^g") == ("r", "g")
+    assert extract_fore_back_chars("&Y", "r", "g") == ("Y", "g")
+    assert extract_fore_back_chars("^K", "r", "g") == ("r", "K")
+    assert extract_fore_back_chars(None, "r", "g") == ("r", "g")
+    for colorstr in ["&r^g", "&C^M", "&", "^", "&^k", "y", "&Q^Y", ""]:
+        assert extract_fore_back_chars(colorstr, "r", "g") == (
+            extract_foreground_char(colorstr, "r"),
+            extract_background_char(colorstr, "g"),
+        )
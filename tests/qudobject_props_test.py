@@ -2,6 +2,8 @@
 
 The qindex fixture is supplied by tests/conftest.py."""
 
+import pytest
+
 from hagadias.helpers import strip_oldstyle_qud_colors
 
 
@@ -10,10 +12,9 @@ def test_strip_qud_color_codes():
 
 
 # Properties
-def test_av(qindex):
-    assert qindex["Chain Mail"].av == 3
-    assert qindex["Stopsvaalinn"].av == 3
-    assert qindex["Basalt"].av == 10
+@pytest.mark.parametrize("name, expected", [("Chain Mail", 3), ("Stopsvaalinn", 3), ("Basalt", 10)])
+def test_av(qindex, name, expected):
+    assert qindex[name].av == expected
 
 
 def test_chargeused(qindex):
@@ -26,10 +27,11 @@ def test_displayname(qindex):
     assert qindex["Cudgel6"].displayname == "crysteel mace"
 
 
-def test_dv(qindex):
-    assert qindex["Chain Mail"].dv == -1
-    assert qindex["Stopsvaalinn"].dv == 0
-    assert qindex["Basalt"].dv == -10
+@pytest.mark.parametrize(
+    "name, expected", [("Chain Mail", -1), ("Stopsvaalinn", 0), ("Basalt", -10)]
+)
+def test_dv(qindex, name, expected):
+    assert qindex[name].dv == expected
 
 
 def test_mentalshield(qindex):
@@ -43,7 +45,6 @@ def test_extrainfo(qindex):
     assert qindex["Prayer Rod"].energycellrequired is True
 
 
-def test_tier(qindex):
-    assert qindex["Tattoo Gun"].tier == 3
-    assert qindex["HandENuke"].tier == 8
-    assert qindex["Glowfish"].tier == 0
+@pytest.mark.parametrize("name, expected", [("Tattoo Gun", 3), ("HandENuke", 8), ("Glowfish", 0)])
+def test_tier(qindex, name, expected):
+    assert qindex[name].tier == expected
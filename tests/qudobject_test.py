@@ -2,7 +2,11 @@
 
 The qindex fixture is supplied by tests/conftest.py."""
 
+import pytest
+from lxml import etree
+
 from hagadias import qudtile
+from hagadias.qudobject import QudObject
 
 
 def test_tile(qindex):
@@ -20,16 +24,44 @@ def test_ui_inheritance_path(qindex):
     assert obj.ui_inheritance_path() == want
 
 
-def test_inherits_from(qindex):
+@pytest.mark.parametrize(
+    "name, ancestor, expected",
+    [
+        ("Stopsvaalinn", "BaseShield", True),
+        ("Stopsvaalinn", "Item", True),
+        ("Stopsvaalinn", "InorganicObject", True),
+        ("Stopsvaalinn", "PhysicalObject", True),
+        ("Stopsvaalinn", "Object", True),
+        ("Stopsvaalinn", "Widget", False),
+        ("Object", "Object", True),
+    ],
+)
+def test_inherits_from(qindex, name, ancestor, expected):
+    assert qindex[name].inherits_from(ancestor) is expected
+
+
+LINEAGE_BLUEPRINTS = """<objects>
+<object Name="Object" />
+<object Name="Item" Inherits="Object" />
+<object Name="BaseShield" Inherits="Item" />
+<object Name="Stopsvaalinn" Inherits="BaseShield" />
+<object Name="Widget" Inherits="Object" />
+</objects>"""
+
+
+def test_inherits_from_before_and_after_baking():
+    qindex = {}
+    for blueprint in etree.fromstring(LINEAGE_BLUEPRINTS):
+        QudObject(blueprint, qindex, None)
     obj = qindex["Stopsvaalinn"]
-    assert obj.inherits_from("BaseShield")
-    assert obj.inherits_from("Item")
-    assert obj.inherits_from("InorganicObject")
-    assert obj.inherits_from("PhysicalObject")
-    assert obj.inherits_from("Object")
-    assert not obj.inherits_from("Widget")
-    obj = qindex["Object"]
-    assert obj.inherits_from("Object")
+    names = list(qindex)
+    # an unbaked object knows only its own name, and asking about it must not stick
+    assert [obj.inherits_from(name) for name in names] == [False, False, False, True, False]
+    for qud_object in qindex.values():
+        qud_object.resolve_inheritance()
+    expected = [True, True, True, True, False]
+    assert [obj.inherits_from(name) for name in names] == expected
+    assert [obj.inherits_from(name) for name in names] == expected
 
 
 def test_is_specified(qindex):
@@ -0,0 +1,42 @@
+"""pytest tests to test functions in tilepainter.py.
+
+The qindex fixture is supplied by tests/conftest.py."""
+
+import pytest
+
+from hagadias.tilepainter import HOLO_COLORS, TilePainter, paint_all
+
+
+@pytest.mark.parametrize("name", ["Wraith-Knight Templar", "Holographic Ivory"])
+def test_hologram_colors(qindex, name):
+    # holograms take the first primer case, even when they also have parts (such as animated
+    # materials) that a later case would handle
+    painter = TilePainter(qindex[name])
+    assert painter.tile() is not None
+    assert (painter.color, painter.tilecolor, painter.detail) == HOLO_COLORS
+
+
+def test_invert_filename_direction(qindex):
+    painter = TilePainter(qindex["Object"])
+    painter.file = "Tiles/sw_door_e_w.bmp"  # two markers: only '_w.' is swapped
+    assert painter._invert_filename_direction() is True
+    assert painter.file == "Tiles/sw_door_e_e.bmp"
+    painter.file = "Tiles/sw_gate_w_e.bmp"  # '_w_' is checked first
+    assert painter._invert_filename_direction() is True
+    assert painter.file == "Tiles/sw_gate_e_e.bmp"
+    painter.file = "Tiles/sw_gate.bmp"
+    assert painter._invert_filename_direction() is False
+    assert painter.file == "Tiles/sw_gate.bmp"
+
+
+def test_paint_all(qindex):
+    objects = [
+        qindex[name] for name in ("Object", "Chain Mail", "Portable Beehive", "Stopsvaalinn")
+    ]
+    painted = list(paint_all(objects))
+    assert [qud_object for qud_object, _, _ in painted] == objects
+    for qud_object, tiles, metadata in painted:
+        expected_tiles, expected_metadata = qud_object.tiles_and_metadata()
+        assert tiles is expected_tiles
+        assert metadata is expected_metadata
+        assert len(tiles) == len(metadata) == qud_object.number_of_tiles()
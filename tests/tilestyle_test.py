@@ -0,0 +1,265 @@
+"""pytest tests to test tile styles in tilestyle.py.
+
+The qindex fixture is supplied by tests/conftest.py."""
+
+import pytest
+from lxml import etree
+
+from hagadias.qudobject_props import QudObjectProps
+from hagadias.tilepainter import TilePainter
+from hagadias.tilestyle import (
+    StyleAloes,
+    StyleAsterisk,
+    StyleDoor,
+    StyleDoubleContainer,
+    StyleEnclosing,
+    StyleExaminerUnknown,
+    StyleFixtureWithChildAlternates,
+    StyleFracti,
+    StyleHangable,
+    StyleHarvestable,
+    StyleMachineWallTubing,
+    StyleManager,
+    StylePistonPress,
+    StyleRandomColors,
+    StyleRandomTile,
+    StyleRandomTonic,
+    StyleSofa,
+    StyleSultanMuralEndcap,
+    StyleSultanMuralMedian,
+    StyleSultanMuralWall,
+    StyleSultanShrine,
+    StyleTombstone,
+    StyleVillageMonument,
+    _index_style_triggers,
+)
+
+
+@pytest.mark.parametrize("name", ["Grave Moss", "Door"])
+def test_apply_style_out_of_range(qindex, name):
+    style_manager = TilePainter(qindex[name])._style_manager
+    style_manager.apply_style(style_manager.style_count() - 1)
+    with pytest.raises(IndexError):
+        style_manager.apply_style(style_manager.style_count())
+
+
+@pytest.mark.parametrize("name", ["Grave Moss", "Flowers", "Double Door"])
+def test_all_tiles_match_apply_style(qindex, name):
+    # all_tiles_and_metadata() paints every variant with StyleManager.apply_all_styles(), while
+    # tile(index) paints a single variant with StyleManager.apply_style(index)
+    stepped_tiles, stepped_metadata = TilePainter(qindex[name]).all_tiles_and_metadata()
+    decoded = TilePainter(qindex[name])
+    for index in range(decoded.tile_count()):
+        decoded.tile(index)
+    decoded_tiles, decoded_metadata = decoded.all_tiles_and_metadata()
+    assert len(stepped_tiles) == decoded.tile_count() > 1
+    assert [meta.type for meta in stepped_metadata] == [meta.type for meta in decoded_metadata]
+    assert [meta.postfix for meta in stepped_metadata] == [
+        meta.postfix for meta in decoded_metadata
+    ]
+    assert [tile.get_bytes() for tile in stepped_tiles] == [
+        tile.get_bytes() for tile in decoded_tiles
+    ]
+
+
+def test_fixture_color_variants_shared(qindex):
+    family = [obj for obj in qindex.values() if obj.inheritingfrom == "ColumbariumWall"]
+    first = StyleFixtureWithChildAlternates(TilePainter(family[0]))
+    second = StyleFixtureWithChildAlternates(TilePainter(family[1]))
+    assert first._matches is not None
+    assert first._matches is second._matches
+
+
+def _load_blueprints(xml: str) -> dict:
+    """Builds a small object index from the specified ObjectBlueprints XML."""
+    qindex = {}
+    for blueprint in etree.fromstring(xml):
+        QudObjectProps(blueprint, qindex, None)
+    for qud_object in qindex.values():
+        qud_object.resolve_inheritance()
+    return qindex
+
+
+FIXTURE_BLUEPRINTS = """<objects>
+<object Name="Object"><part Name="Render" DisplayName="object" /></object>
+<object Name="ColumbariumWall" Inherits="Object">
+  <part Name="Render" Tile="Walls/sw_columbarium.bmp" ColorString="&amp;w" DetailColor="y" />
+</object>
+<object Name="ColumbariumWall B" Inherits="ColumbariumWall">
+  <part Name="Render" ColorString="&amp;r" />
+</object>
+<object Name="ColumbariumWall A" Inherits="ColumbariumWall">
+  <part Name="Render" ColorString="&amp;g" TileColor="&amp;G" />
+</object>
+<object Name="ColumbariumWall C" Inherits="ColumbariumWall">
+  <part Name="Render" ColorString="&amp;r" />
+</object>
+<object Name="GlassHydraulicPipe" Inherits="Object">
+  <part Name="Render" Tile="Walls/sw_pipe.bmp" ColorString="&amp;c" />
+</object>
+</objects>"""
+
+
+def test_fixture_color_variants():
+    qindex = _load_blueprints(FIXTURE_BLUEPRINTS)
+    variants = StyleFixtureWithChildAlternates._collect_color_variants(qindex)
+    # ordered by object name, with the duplicate colors of ColumbariumWall C left out
+    assert variants["ColumbariumWall"] == [("&w", None, "y"), ("&g", "&G", "y"), ("&r", None, "y")]
+    assert variants["GlassHydraulicPipe"] == [("&c", None, None)]
+    assert variants["FulcreteWithSquareWave"] == []
+
+
+class _Triggered:
+    TRIGGERS = ("part_Door",)
+    TRIGGER_NAMES = ()
+
+
+class _Named:
+    TRIGGERS = ()
+    TRIGGER_NAMES = ("Sofa", "Village Monument")
+
+
+class _Untriggered:
+    TRIGGERS = ()
+    TRIGGER_NAMES = ()
+
+
+class _AlsoTriggered:
+    TRIGGERS = ("part_Door", "part_Hangable")
+    TRIGGER_NAMES = ("Sofa",)
+
+
+def test_index_style_triggers():
+    untriggered, by_trigger, by_name = _index_style_triggers(
+        [_Triggered, _Named, _Untriggered, _AlsoTriggered]
+    )
+    assert untriggered == [(2, _Untriggered)]
+    assert by_trigger == {
+        "part_Door": [(0, _Triggered), (3, _AlsoTriggered)],
+        "part_Hangable": [(3, _AlsoTriggered)],
+    }
+    assert by_name == {
+        "Sofa": [(1, _Named), (3, _AlsoTriggered)],
+        "Village Monument": [(1, _Named)],
+    }
+
+
+def test_style_trigger_tables():
+    for position, style_class in enumerate(StyleManager.Styles):
+        assert ((position, style_class) in StyleManager._UNTRIGGERED_STYLES) == (
+            not style_class.TRIGGERS and not style_class.TRIGGER_NAMES
+        )
+        for trigger in style_class.TRIGGERS:
+            assert (position, style_class) in StyleManager._STYLES_BY_TRIGGER[trigger]
+        for name in style_class.TRIGGER_NAMES:
+            assert (position, style_class) in StyleManager._STYLES_BY_NAME[name]
+
+
+TRIGGERED_BLUEPRINTS = """<objects>
+<object Name="Object"><part Name="Render" DisplayName="object" /></object>
+<object Name="Plant" Inherits="Object">
+  <part Name="Render" Tile="Items/sw_beehive.bmp" ColorString="&amp;g" DetailColor="G" />
+</object>
+<object Name="Aloe Volta" Inherits="Plant"><part Name="DischargeOnStep" /></object>
+<object Name="Grave Moss" Inherits="Plant">
+  <part Name="Harvestable" RipeColor="&amp;M" UnripeColor="&amp;g" RipeDetailColor="M"
+        UnripeDetailColor="g" />
+  <builder Name="RandomTile" Tiles="Items/moss_1.bmp,Items/moss_2.bmp" />
+</object>
+<object Name="Door" Inherits="Object">
+  <part Name="Render" Tile="Tiles/door.bmp" ColorString="&amp;y" />
+  <part Name="Door" ClosedTile="Tiles/door_c.bmp" OpenTile="Tiles/door_o.bmp" />
+</object>
+<object Name="Chest" Inherits="Object">
+  <part Name="Render" Tile="Tiles/chest_w.bmp" ColorString="&amp;w" />
+  <part Name="DoubleContainer" />
+</object>
+<object Name="Enclosure" Inherits="Object">
+  <part Name="Render" Tile="Tiles/enc_w.bmp" ColorString="&amp;w" />
+  <part Name="Enclosing" ClosedTile="Tiles/enc_c.bmp" />
+</object>
+<object Name="Gadget" Inherits="Plant">
+  <part Name="Examiner" Complexity="3" /><tag Name="Tier" Value="3" />
+</object>
+<object Name="UnknownMed" Inherits="Object">
+  <part Name="Render" Tile="Items/med.bmp" ColorString="&amp;K" />
+</object>
+<object Name="BaseUnknown" Inherits="Object">
+  <part Name="Render" Tile="Items/unknown.bmp" ColorString="&amp;K" DetailColor="" />
+</object>
+<object Name="Tonic" Inherits="Plant">
+  <part Name="Examiner" Unknown="UnknownMed" Complexity="2" />
+</object>
+<object Name="Fracti" Inherits="Plant"><part Name="Fracti" /></object>
+<object Name="Hanging Lamp" Inherits="Plant">
+  <part Name="Hangable" HangingTile="Items/lamp_hanging.bmp" />
+</object>
+<object Name="Piston" Inherits="Object"><part Name="PistonPressElement" /></object>
+<object Name="Flowers" Inherits="Plant">
+  <part Name="RandomColors" MainColor="R,G,B" TileColor="Y,W" />
+</object>
+<object Name="Shrine" Inherits="Object">
+  <part Name="Render" Tile="Items/shrine.bmp" ColorString="&amp;c^k" />
+  <part Name="SultanShrine" />
+</object>
+<object Name="Mural" Inherits="Object">
+  <part Name="Render" Tile="Walls/mural.bmp" ColorString="&amp;c" />
+  <part Name="SultanMural" /><tag Name="PaintedWall" Value="sw_mural" />
+</object>
+<object Name="Tombstone" Inherits="Plant"><part Name="Tombstone" /></object>
+<object Name="Asterisk" Inherits="Plant"><part Name="PointedAsteriskBuilder" /></object>
+<object Name="ColumbariumWall" Inherits="Object">
+  <part Name="Render" Tile="Walls/sw_columbarium.bmp" ColorString="&amp;w" DetailColor="y" />
+</object>
+<object Name="ColumbariumWall A" Inherits="ColumbariumWall">
+  <part Name="Render" ColorString="&amp;g" />
+</object>
+<object Name="MachineWallHotTubing" Inherits="Plant">
+  <part Name="DrawInTheDark" ForegroundTileColor="R" BackgroundTileColor="r" />
+</object>
+<object Name="Sofa" Inherits="Object">
+  <part Name="Render" Tile="Items/sofa_c.bmp" ColorString="&amp;w" />
+</object>
+<object Name="BaseMuralLeftend" Inherits="Object">
+  <part Name="Render" Tile="Walls/mural.bmp" ColorString="&amp;c" />
+</object>
+<object Name="BaseMuralCenter" Inherits="Object">
+  <part Name="Render" Tile="Walls/mural.bmp" ColorString="&amp;c" />
+</object>
+<object Name="Village Monument" Inherits="Plant" />
+<object Name="Village Monument 1" Inherits="Village Monument" />
+</objects>"""
+
+
+@pytest.mark.parametrize(
+    "name, style_class",
+    [
+        ("Aloe Volta", StyleAloes),
+        ("Asterisk", StyleAsterisk),
+        ("Door", StyleDoor),
+        ("Chest", StyleDoubleContainer),
+        ("Enclosure", StyleEnclosing),
+        ("Gadget", StyleExaminerUnknown),
+        ("ColumbariumWall A", StyleFixtureWithChildAlternates),
+        ("Fracti", StyleFracti),
+        ("Hanging Lamp", StyleHangable),
+        ("Grave Moss", StyleHarvestable),
+        ("MachineWallHotTubing", StyleMachineWallTubing),
+        ("Piston", StylePistonPress),
+        ("Flowers", StyleRandomColors),
+        ("Grave Moss", StyleRandomTile),
+        ("Tonic", StyleRandomTonic),
+        ("Sofa", StyleSofa),
+        ("Shrine", StyleSultanShrine),
+        ("BaseMuralLeftend", StyleSultanMuralEndcap),
+        ("BaseMuralCenter", StyleSultanMuralMedian),
+        ("Mural", StyleSultanMuralWall),
+        ("Tombstone", StyleTombstone),
+        ("Village Monument 1", StyleVillageMonument),
+    ],
+)
+def test_triggered_styles_applied(name, style_class):
+    qindex = _load_blueprints(TRIGGERED_BLUEPRINTS)
+    painter = TilePainter(qindex[name])
+    assert style_class(painter).is_applicable
+    assert style_class in [type(style) for style in painter._style_manager._applicable_styles]